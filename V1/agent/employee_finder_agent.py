@@ -4,7 +4,9 @@ Core AI agent for finding the right people based on user queries
 Implements survey insights: ownership-first, role-before-person, time-saving focus
 """
 import re
+import sys
 import json
+from array import array
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import uuid
@@ -13,6 +15,23 @@ from database.models import Employee, RecommendationResult, AgentResponse
 from database.db_manager import DatabaseManager
 
 
+def _flatten_patterns(*groups: Dict[str, List[str]]) -> Tuple[Tuple[str, ...], array, array]:
+    """
+    Flatten {label: [patterns]} dicts into parallel arrays (structure-of-arrays):
+    interned pattern strings, the group each pattern belongs to, and its label index
+    """
+    patterns = []
+    kinds = array('B')
+    label_idx = array('H')
+    for kind, group in enumerate(groups):
+        for idx, group_patterns in enumerate(group.values()):
+            for pattern in group_patterns:
+                patterns.append(sys.intern(pattern))
+                kinds.append(kind)
+                label_idx.append(idx)
+    return tuple(patterns), kinds, label_idx
+
+
 class EmployeeFinderAgent:
     """
     AI Agent for employee discovery and team formation
@@ -41,6 +60,14 @@ class EmployeeFinderAgent:
         'customer support': ['customer support', 'helpdesk', 'service desk'],
         'billing operations': ['billing', 'invoice', 'payment'],
     }
+
+    # Flattened pattern table used by _parse_query (kind 0 = domain, 1 = responsibility)
+    _PATTERNS, _PATTERN_KIND, _PATTERN_LABEL_IDX = _flatten_patterns(DOMAIN_KEYWORDS, RESPONSIBILITY_AREAS)
+    _LABELS = (tuple(DOMAIN_KEYWORDS), tuple(RESPONSIBILITY_AREAS))
+
+    # Confidence lookup indexed by (score_bucket << 1) | has_primary_owner
+    # score_bucket: 0 = top score < 0.5, 1 = 0.5 <= score < 0.8, 2 = score >= 0.8
+    _CONF_TABLE = ('low', 'medium', 'medium', 'medium', 'medium', 'high')
     
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
@@ -68,10 +95,10 @@ class EmployeeFinderAgent:
         recommendations = self._find_matching_employees(parsed_intent)
         
         # Step 4: Enrich with people leader info (Survey insight: show backup/escalation)
-        recommendations = self._enrich_with_leaders(recommendations)
+        recommendations, has_ownership = self._enrich_with_leaders(recommendations)
         
         # Step 5: Determine confidence level
-        confidence = self._calculate_confidence(recommendations, parsed_intent)
+        confidence = self._calculate_confidence(recommendations, parsed_intent, has_ownership)
         
         # Step 6: Generate understanding summary
         understanding = self._generate_understanding(user_query, parsed_intent, recommended_roles)
@@ -111,17 +138,15 @@ class EmployeeFinderAgent:
         # Extract keywords
         keywords = re.findall(r'\b\w+\b', query_lower)
         
-        # Identify domains
-        domains = []
-        for domain, patterns in self.DOMAIN_KEYWORDS.items():
-            if any(pattern in query_lower for pattern in patterns):
-                domains.append(domain)
-        
-        # Identify responsibility areas
-        responsibilities = []
-        for resp, patterns in self.RESPONSIBILITY_AREAS.items():
-            if any(pattern in query_lower for pattern in patterns):
-                responsibilities.append(resp)
+        # Identify domains and responsibility areas in one pass over the pattern table
+        matched = (set(), set())
+        for pattern, kind, label_idx in zip(self._PATTERNS, self._PATTERN_KIND, self._PATTERN_LABEL_IDX):
+            if pattern in query_lower:
+                matched[kind].add(label_idx)
+
+        domain_labels, responsibility_labels = self._LABELS
+        domains = [domain_labels[i] for i in sorted(matched[0])]
+        responsibilities = [responsibility_labels[i] for i in sorted(matched[1])]
         
         # Extract potential team/function mentions
         teams = self._extract_teams(query_lower)
@@ -204,17 +229,16 @@ class EmployeeFinderAgent:
         # Strategy 1: Find by responsibility ownership (HIGHEST PRIORITY - Survey insight)
         for responsibility in parsed_intent.get('responsibilities', []):
             owners = self.db.get_owners_by_responsibility(responsibility)
-            for owner_data in owners:
-                employee = owner_data['employee']
-                score = 0.9 if owner_data['ownership_type'] == 'primary' else 0.7
+            for employee, ownership_type, area in owners:
+                score = 0.9 if ownership_type == 'primary' else 0.7
 
                 candidates.append(RecommendationResult(
                     employee=employee,
                     match_score=score,
                     match_reasons=[
-                        f"Primary owner of: {owner_data['responsibility_area']}"
+                        f"Primary owner of: {area}"
                     ],
-                    ownership_type=owner_data['ownership_type']
+                    ownership_type=ownership_type
                 ))
 
         # Strategy 2: Find by skills/domains
@@ -262,34 +286,34 @@ class EmployeeFinderAgent:
 
         return candidates
 
-    def _enrich_with_leaders(self, recommendations: List[RecommendationResult]) -> List[RecommendationResult]:
+    def _enrich_with_leaders(self, recommendations: List[RecommendationResult]) -> Tuple[List[RecommendationResult], bool]:
         """
         Add people leader info for backup/escalation (Survey insight)
+        Also returns whether a primary owner is in the top 3, for _calculate_confidence
         """
-        for rec in recommendations:
+        has_ownership = False
+        for i, rec in enumerate(recommendations):
+            if i < 3 and rec.ownership_type == 'primary':
+                has_ownership = True
             if rec.employee.people_leader_id:
                 leader = self.db.get_employee_by_id(rec.employee.people_leader_id)
                 if leader:
                     rec.people_leader = leader
 
-        return recommendations
+        return recommendations, has_ownership
 
-    def _calculate_confidence(self, recommendations: List[RecommendationResult], parsed_intent: Dict) -> str:
+    def _calculate_confidence(self, recommendations: List[RecommendationResult], parsed_intent: Dict,
+                              has_ownership: bool) -> str:
         """
         Calculate confidence level based on match quality
+        has_ownership: whether a primary owner is in the top 3 (from _enrich_with_leaders)
         """
         if not recommendations:
             return 'low'
 
         top_score = recommendations[0].match_score
-        has_ownership = any(r.ownership_type == 'primary' for r in recommendations[:3])
-
-        if top_score >= 0.8 and has_ownership:
-            return 'high'
-        elif top_score >= 0.5 or has_ownership:
-            return 'medium'
-        else:
-            return 'low'
+        score_bucket = (top_score >= 0.5) + (top_score >= 0.8)
+        return self._CONF_TABLE[(score_bucket << 1) | has_ownership]
 
     def _generate_understanding(self, query: str, parsed_intent: Dict, roles: List[str]) -> str:
         """
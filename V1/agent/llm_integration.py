@@ -6,9 +6,42 @@ import os
 import json
 from typing import List, Dict, Optional, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from abc import ABC, abstractmethod
 
 
+# Longest Retry-After wait honoured before a retry; a server asking for more gets this
+RETRY_AFTER_MAX_SECONDS = 5
+
+
+class _CappedRetry(Retry):
+    """Retry whose Retry-After waits are capped at RETRY_AFTER_MAX_SECONDS"""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX_SECONDS)
+
+
+# Retry policy for LLM endpoints: transient 5xx and 429 rate limits are retried
+# inside the connection pool with jittered exponential backoff (at most 2 s per wait),
+# honouring a capped Retry-After. read=0: a POST that timed out waiting for the
+# response may already be running server-side, so it is not sent again
+LLM_RETRY = _CappedRetry(
+    total=3,
+    read=0,
+    backoff_factor=0.2,
+    backoff_jitter=0.1,
+    backoff_max=2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset({'POST'}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
@@ -35,6 +68,12 @@ class OpenAIProvider(LLMProvider):
         self.base_url = base_url.rstrip('/')
         self.model = model
         self.temperature = temperature
+
+        # Persistent session so retries and follow-up calls reuse pooled connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(max_retries=LLM_RETRY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def generate(self, messages: List[Dict[str, str]], tools: Optional[List[Dict]] = None) -> Dict[str, Any]:
         """
@@ -65,7 +104,7 @@ class OpenAIProvider(LLMProvider):
             payload["tool_choice"] = "auto"
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=headers,
                 json=payload,
@@ -83,13 +122,20 @@ class OpenAIProvider(LLMProvider):
                 'finish_reason': choice.get('finish_reason', 'stop')
             }
             
-        except Exception as e:
-            # Fallback to non-AI response
+        except requests.RequestException as e:
+            # Fallback to non-AI response (retries already exhausted by the adapter)
             return {
                 'content': f"Error calling LLM: {str(e)}",
                 'tool_calls': [],
                 'finish_reason': 'error'
             }
+        except (KeyError, IndexError, ValueError) as e:
+            # Malformed or non-JSON response body
+            return {
+                'content': f"Invalid LLM response: {str(e)}",
+                'tool_calls': [],
+                'finish_reason': 'error'
+            }
 
 
 class LocalLLMProvider(LLMProvider):
@@ -45,6 +45,20 @@ class QueryRouter:
         r'\b(yes|no|ok|okay)\b',
     ]
     
+    # Pattern: "find/show/who [someone/people] in/from [team/location]" or "... [role]"
+    SIMPLE_SEARCH_PATTERNS = [
+        (r'(?:find|show|who).*?(?:in|from)\s+(\w+)\s+(team|department|group)', 'team'),
+        (r'(?:find|show|who).*?(?:in|from)\s+(\w+)\s+(office|location|site)', 'location'),
+        (r'(?:find|show|who).*?(\w+)\s+(engineer|specialist|manager|lead|analyst)', 'role'),
+    ]
+    
+    # Compiled once at import; routers only bind these
+    _EMAIL_RE = re.compile(EMAIL_PATTERN)
+    _CONVERSATIONAL_RE = re.compile('|'.join(CONVERSATIONAL_PATTERNS))
+    _SIMPLE_SEARCH_RES = tuple(
+        (re.compile(pattern), search_type) for pattern, search_type in SIMPLE_SEARCH_PATTERNS
+    )
+    
     def __init__(self):
         pass
     
@@ -64,7 +78,7 @@ class QueryRouter:
         query_lower = query.lower().strip()
         
         # 1. Check for direct email lookup
-        email_match = re.search(self.EMAIL_PATTERN, query)
+        email_match = self._EMAIL_RE.search(query)
         if email_match:
             return {
                 'query_type': QueryType.DIRECT_LOOKUP,
@@ -75,15 +89,14 @@ class QueryRouter:
             }
         
         # 2. Check for conversational queries
-        for pattern in self.CONVERSATIONAL_PATTERNS:
-            if re.search(pattern, query_lower):
-                return {
-                    'query_type': QueryType.CONVERSATIONAL,
-                    'strategy': 'ai',
-                    'confidence': 0.9,
-                    'extracted_info': {},
-                    'reasoning': 'Conversational query - AI response needed'
-                }
+        if self._CONVERSATIONAL_RE.search(query_lower):
+            return {
+                'query_type': QueryType.CONVERSATIONAL,
+                'strategy': 'ai',
+                'confidence': 0.9,
+                'extracted_info': {},
+                'reasoning': 'Conversational query - AI response needed'
+            }
         
         # 3. Check for simple search patterns
         simple_search_info = self._detect_simple_search(query_lower)
@@ -132,15 +145,8 @@ class QueryRouter:
             'reason': ''
         }
         
-        # Pattern: "find/show/who [someone/people] in/from [team/location]"
-        patterns = [
-            (r'(?:find|show|who).*?(?:in|from)\s+(\w+)\s+(team|department|group)', 'team'),
-            (r'(?:find|show|who).*?(?:in|from)\s+(\w+)\s+(office|location|site)', 'location'),
-            (r'(?:find|show|who).*?(\w+)\s+(engineer|specialist|manager|lead|analyst)', 'role'),
-        ]
-        
-        for pattern, search_type in patterns:
-            match = re.search(pattern, query)
+        for pattern, search_type in self._SIMPLE_SEARCH_RES:
+            match = pattern.search(query)
             if match:
                 result['is_simple'] = True
                 result['confidence'] = 0.8
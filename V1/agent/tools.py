@@ -3,12 +3,17 @@ Tools for AI Agent to interact with the employee database
 These tools can be called by LLM or used directly
 """
 from typing import List, Dict, Optional, Any
+from operator import attrgetter
 import json
 
-from database.db_manager import DatabaseManager
+from database.db_manager import DatabaseManager, EMPLOYEE_DICT_KEYS, EMPLOYEE_DICT_FIELDS
 from database.models import Employee
 
 
+# Employee attributes behind the tool result keys (EMPLOYEE_DICT_KEYS)
+_employee_fields = attrgetter(*EMPLOYEE_DICT_FIELDS)
+
+
 class EmployeeSearchTools:
     """
     Collection of tools that the AI agent can use to search for employees
@@ -58,11 +63,11 @@ class EmployeeSearchTools:
         Example:
             find_by_team("Network Infrastructure")
         """
-        employees = self.db.search_employees_by_criteria(
+        return self.db.search_employees_by_criteria(
             team=team_name,
-            limit=limit
+            limit=limit,
+            as_dicts=True
         )
-        return [self._employee_to_dict(emp) for emp in employees]
     
     # ============================================
     # Tool 3: Search by Role/Position
@@ -82,11 +87,11 @@ class EmployeeSearchTools:
         Example:
             find_by_role("Network Engineer")
         """
-        employees = self.db.search_employees_by_criteria(
+        return self.db.search_employees_by_criteria(
             position_keywords=role_keywords,
-            limit=limit
+            limit=limit,
+            as_dicts=True
         )
-        return [self._employee_to_dict(emp) for emp in employees]
     
     # ============================================
     # Tool 4: Search by Skill
@@ -106,20 +111,20 @@ class EmployeeSearchTools:
         Example:
             find_by_skill("provisioning", min_confidence=0.6)
         """
-        employees = self.db.get_employees_by_skill(skill_name, min_confidence)
-        return [self._employee_to_dict(emp) for emp in employees]
+        return self.db.get_employees_by_skill(skill_name, min_confidence, as_dicts=True)
     
     # ============================================
     # Tool 5: Search by Responsibility/Ownership
     # ============================================
     
-    def find_by_responsibility(self, responsibility: str) -> List[Dict[str, Any]]:
+    def find_by_responsibility(self, responsibility: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Find employees responsible for a specific area
         Returns primary owners first, then backups
         
         Args:
             responsibility: Responsibility area (e.g., "BIA provisioning")
+            limit: Maximum number of results (all owners if None)
             
         Returns:
             List of dicts with employee info and ownership type
@@ -127,16 +132,7 @@ class EmployeeSearchTools:
         Example:
             find_by_responsibility("network setup")
         """
-        owners = self.db.get_owners_by_responsibility(responsibility)
-        
-        results = []
-        for owner_data in owners:
-            emp_dict = self._employee_to_dict(owner_data['employee'])
-            emp_dict['ownership_type'] = owner_data['ownership_type']
-            emp_dict['responsibility_area'] = owner_data['responsibility_area']
-            results.append(emp_dict)
-        
-        return results
+        return self.db.get_owners_by_responsibility(responsibility, limit=limit, as_dicts=True)
     
     # ============================================
     # Tool 6: Full-Text Search
@@ -157,8 +153,7 @@ class EmployeeSearchTools:
         Example:
             search_fulltext("network provisioning Auckland")
         """
-        employees = self.db.search_employees_fulltext(query, limit)
-        return [self._employee_to_dict(emp) for emp in employees]
+        return self.db.search_employees_fulltext_dicts(query, limit)
     
     # ============================================
     # Tool 7: Get Employee with Leader Info
@@ -197,14 +192,5 @@ class EmployeeSearchTools:
     
     def _employee_to_dict(self, employee: Employee) -> Dict[str, Any]:
         """Convert Employee object to dictionary"""
-        return {
-            'id': employee.id,
-            'name': employee.formal_name,
-            'email': employee.email_address,
-            'position': employee.position_title,
-            'team': employee.team,
-            'function': employee.function,
-            'business_unit': employee.business_unit,
-            'location': employee.location
-        }
+        return dict(zip(EMPLOYEE_DICT_KEYS, _employee_fields(employee)))
 
@@ -2,7 +2,9 @@
 Configuration for Company Employee Finder Agent
 """
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -11,43 +13,97 @@ load_dotenv()
 # Base directory
 BASE_DIR = Path(__file__).parent
 
-# Database configuration
-DATABASE_PATH = os.getenv("DATABASE_PATH", str(BASE_DIR / "data" / "employee_directory.db"))
 
-# API configuration
-API_HOST = os.getenv("API_HOST", "0.0.0.0")
-API_PORT = int(os.getenv("API_PORT", "8000"))
-API_RELOAD = os.getenv("API_RELOAD", "True").lower() == "true"
+def _env_bool(name: str, default: str) -> bool:
+    """Read a "True"/"False" environment variable"""
+    return os.getenv(name, default).lower() == "true"
 
-# CORS configuration
-ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "*").split(",")
 
-# Privacy & RAI settings
-SESSION_TIMEOUT_MINUTES = int(os.getenv("SESSION_TIMEOUT_MINUTES", "60"))
-ENABLE_QUERY_LOGGING = os.getenv("ENABLE_QUERY_LOGGING", "True").lower() == "true"
-ANONYMIZE_LOGS = os.getenv("ANONYMIZE_LOGS", "True").lower() == "true"
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """All settings, parsed from the environment once at import"""
+    # Database configuration
+    database_path: str
 
-# Agent configuration
-MAX_RECOMMENDATIONS = int(os.getenv("MAX_RECOMMENDATIONS", "10"))
-MIN_CONFIDENCE_SCORE = float(os.getenv("MIN_CONFIDENCE_SCORE", "0.3"))
+    # API configuration
+    api_host: str
+    api_port: int
+    api_reload: bool
 
-# Time saving estimate (from survey)
-AVERAGE_TIME_SAVED_MINUTES = float(os.getenv("AVERAGE_TIME_SAVED_MINUTES", "39.3"))
+    # CORS configuration
+    allowed_origins: Tuple[str, ...]
 
-# AI & LLM configuration
-USE_AI_ROUTING = os.getenv("USE_AI_ROUTING", "True").lower() == "true"
-ENABLE_LLM = os.getenv("ENABLE_LLM", "False").lower() == "true"  # Disabled by default
+    # Privacy & RAI settings
+    session_timeout_minutes: int
+    enable_query_logging: bool
+    anonymize_logs: bool
 
-# LLM Provider settings
-LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")  # "openai" or "local"
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
-OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    # Agent configuration
+    max_recommendations: int
+    min_confidence_score: float
 
-# Local LLM settings (for Ollama, LocalAI, etc.)
-LOCAL_LLM_ENDPOINT = os.getenv("LOCAL_LLM_ENDPOINT", "http://localhost:11434/v1")
-LOCAL_LLM_MODEL = os.getenv("LOCAL_LLM_MODEL", "llama2")
+    # Time saving estimate (from survey)
+    average_time_saved_minutes: float
 
-# Logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    # AI & LLM configuration
+    use_ai_routing: bool
+    enable_llm: bool  # Disabled by default
 
+    # LLM Provider settings
+    llm_provider: str  # "openai" or "local"
+    openai_api_key: str
+    openai_model: str
+    openai_base_url: str
+
+    # Local LLM settings (for Ollama, LocalAI, etc.)
+    local_llm_endpoint: str
+    local_llm_model: str
+
+    # Logging
+    log_level: str
+
+
+SETTINGS = Settings(
+    database_path=os.getenv("DATABASE_PATH", str(BASE_DIR / "data" / "employee_directory.db")),
+    api_host=os.getenv("API_HOST", "0.0.0.0"),
+    api_port=int(os.getenv("API_PORT", "8000")),
+    api_reload=_env_bool("API_RELOAD", "True"),
+    allowed_origins=tuple(os.getenv("ALLOWED_ORIGINS", "*").split(",")),
+    session_timeout_minutes=int(os.getenv("SESSION_TIMEOUT_MINUTES", "60")),
+    enable_query_logging=_env_bool("ENABLE_QUERY_LOGGING", "True"),
+    anonymize_logs=_env_bool("ANONYMIZE_LOGS", "True"),
+    max_recommendations=int(os.getenv("MAX_RECOMMENDATIONS", "10")),
+    min_confidence_score=float(os.getenv("MIN_CONFIDENCE_SCORE", "0.3")),
+    average_time_saved_minutes=float(os.getenv("AVERAGE_TIME_SAVED_MINUTES", "39.3")),
+    use_ai_routing=_env_bool("USE_AI_ROUTING", "True"),
+    enable_llm=_env_bool("ENABLE_LLM", "False"),
+    llm_provider=os.getenv("LLM_PROVIDER", "openai"),
+    openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+    openai_model=os.getenv("OPENAI_MODEL", "gpt-3.5-turbo"),
+    openai_base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+    local_llm_endpoint=os.getenv("LOCAL_LLM_ENDPOINT", "http://localhost:11434/v1"),
+    local_llm_model=os.getenv("LOCAL_LLM_MODEL", "llama2"),
+    log_level=os.getenv("LOG_LEVEL", "INFO"),
+)
+
+# Module-level names kept for existing imports (read-only views of SETTINGS)
+DATABASE_PATH = SETTINGS.database_path
+API_HOST = SETTINGS.api_host
+API_PORT = SETTINGS.api_port
+API_RELOAD = SETTINGS.api_reload
+ALLOWED_ORIGINS = list(SETTINGS.allowed_origins)
+SESSION_TIMEOUT_MINUTES = SETTINGS.session_timeout_minutes
+ENABLE_QUERY_LOGGING = SETTINGS.enable_query_logging
+ANONYMIZE_LOGS = SETTINGS.anonymize_logs
+MAX_RECOMMENDATIONS = SETTINGS.max_recommendations
+MIN_CONFIDENCE_SCORE = SETTINGS.min_confidence_score
+AVERAGE_TIME_SAVED_MINUTES = SETTINGS.average_time_saved_minutes
+USE_AI_ROUTING = SETTINGS.use_ai_routing
+ENABLE_LLM = SETTINGS.enable_llm
+LLM_PROVIDER = SETTINGS.llm_provider
+OPENAI_API_KEY = SETTINGS.openai_api_key
+OPENAI_MODEL = SETTINGS.openai_model
+OPENAI_BASE_URL = SETTINGS.openai_base_url
+LOCAL_LLM_ENDPOINT = SETTINGS.local_llm_endpoint
+LOCAL_LLM_MODEL = SETTINGS.local_llm_model
+LOG_LEVEL = SETTINGS.log_level
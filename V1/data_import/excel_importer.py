@@ -2,19 +2,63 @@
 Excel data importer for Company Employee Directory
 Imports employee data from Excel and derives skills automatically
 """
-import pandas as pd
+import os
 import re
-from typing import List, Dict, Set
+from bisect import bisect_right
+from itertools import chain
+from typing import Iterable, List, Dict, Set
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
-from database.models import Employee, EmployeeSkill, RoleOwnership
+from openpyxl import load_workbook
+
+from database.models import Employee, EmployeeSkill
 from database.db_manager import DatabaseManager
 
+try:
+    import ahocorasick  # Optional: faster multi-pattern skill matching
+except ImportError:
+    ahocorasick = None
+
+# Upper bound for an "all employees" id range
+_MAX_ROWID = 2 ** 63 - 1
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _ownership_statements(ownership_patterns: Dict[str, List[str]]) -> List[tuple]:
+    """
+    One INSERT ... SELECT per responsibility: matches active employees in an id range
+    (first and last id are appended to the parameters per run) whose position title
+    contains any of its patterns and skips pairs that already exist.
+    Junior/assistant titles become backups unless they are also lead/manager/senior
+    """
+    statements = []
+    for responsibility, patterns in ownership_patterns.items():
+        matches = ' OR '.join(['instr(e.title, ?) > 0'] * len(patterns))
+        sql = f"""
+            INSERT INTO role_ownership (employee_id, responsibility_area, ownership_type, team)
+            SELECT e.id, ?,
+                   CASE WHEN (instr(e.title, 'junior') > 0 OR instr(e.title, 'assistant') > 0)
+                         AND NOT (instr(e.title, 'lead') > 0 OR instr(e.title, 'manager') > 0
+                                  OR instr(e.title, 'senior') > 0)
+                        THEN 'backup' ELSE 'primary' END,
+                   e.team
+            FROM (SELECT id, team, lower(position_title) AS title
+                  FROM employees WHERE is_active = 1) e
+            WHERE ({matches})
+              AND NOT EXISTS (
+                  SELECT 1 FROM role_ownership ro
+                  WHERE ro.employee_id = e.id AND ro.responsibility_area = ?
+              )
+              AND e.id BETWEEN ? AND ?
+        """
+        statements.append((sql, (responsibility, *patterns, responsibility)))
+    return statements
+
+
 class ExcelImporter:
     """Import employee data from Excel file"""
     
@@ -46,10 +90,60 @@ class ExcelImporter:
         'crm': ['crm', 'customer relationship'],
         'procurement': ['procurement', 'purchasing'],
     }
+
+    # Broad category of each skill
+    _SKILL_CATEGORY = {
+        **dict.fromkeys(['provisioning', 'network', 'cloud', 'security', 'database',
+                         'devops', 'api', 'mobile', 'web'], 'Technical'),
+        **dict.fromkeys(['sales', 'compliance', 'product', 'engineering', 'support',
+                         'analytics', 'project management'], 'Domain'),
+        **dict.fromkeys(['bia', 'billing', 'crm', 'procurement'], 'Process'),
+    }
+
+    # All skill patterns as one word-bounded alternation (longest first),
+    # so each employee's text is scanned once instead of once per pattern
+    _SKILL_RE = re.compile(r'\b(' + '|'.join(
+        re.escape(p) for p in sorted({p for pats in SKILL_PATTERNS.values() for p in pats}, key=len, reverse=True)
+    ) + r')\b')
+
+    # Aho-Corasick automaton over the same patterns (None without pyahocorasick)
+    if ahocorasick is not None:
+        _SKILL_AUTOMATON = ahocorasick.Automaton()
+        for _pattern in {p for pats in SKILL_PATTERNS.values() for p in pats}:
+            _SKILL_AUTOMATON.add_word(_pattern, _pattern)
+        _SKILL_AUTOMATON.make_automaton()
+        del _pattern
+    else:
+        _SKILL_AUTOMATON = None
     
+    # Responsibility areas derived from position titles
+    OWNERSHIP_PATTERNS = {
+        'provisioning': ['provisioning', 'provision'],
+        'network setup': ['network', 'infrastructure'],
+        'security compliance': ['security', 'compliance', 'risk'],
+        'customer support': ['support', 'service desk', 'helpdesk'],
+        'billing operations': ['billing', 'invoice'],
+        'product management': ['product manager', 'product owner'],
+        'project delivery': ['project manager', 'programme'],
+    }
+    _OWNERSHIP_STATEMENTS = _ownership_statements(OWNERSHIP_PATTERNS)
+
+    # Employees per skill-derivation shard; smaller imports run on the calling thread
+    SKILL_SHARD_SIZE = 5000
+
+    # Sheet rows buffered before their employees are written
+    IMPORT_CHUNK_ROWS = 1000
+
+    # Columns read from the sheet, in the order rows are unpacked
+    IMPORT_COLUMNS = [
+        'Formal Name', 'Email Address', 'People Leader Formal Name', 'Position Title',
+        'Function (Label)', 'Business Unit (Label)', 'Team (Label)', 'Location (Name)',
+    ]
+
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
         self.employee_cache: Dict[str, int] = {}  # email -> id mapping
+        self._imported_employees: List[Employee] = []  # Employees written by the current import
     
     def import_from_excel(self, excel_path: str) -> Dict[str, int]:
         """
@@ -66,127 +160,210 @@ class ExcelImporter:
         - Location (Name)
         """
         logger.info(f"Starting import from {excel_path}")
-        
-        # Read Excel file
-        df = pd.read_excel(excel_path)
-        
-        # Normalize column names
-        df.columns = df.columns.str.strip()
-        
-        # Validate required columns
-        required_cols = ['Formal Name', 'Email Address', 'Position Title']
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        if missing_cols:
-            raise ValueError(f"Missing required columns: {missing_cols}")
-        
-        # Clean data
-        df = df.fillna('')
+
+        # Stream the sheet (validates the header up front)
+        rows = self._read_rows(excel_path)
         
         stats = {
-            'total_rows': len(df),
+            'total_rows': 0,
             'imported_employees': 0,
             'imported_skills': 0,
             'imported_ownerships': 0,
             'errors': 0
         }
         
-        # First pass: Import all employees (without people leader FK)
-        logger.info("First pass: Importing employees...")
-        for idx, row in df.iterrows():
-            try:
-                employee = self._row_to_employee(row)
-                employee_id = self.db.insert_employee(employee)
-                self.employee_cache[employee.email_address.lower()] = employee_id
-                stats['imported_employees'] += 1
-                
-                if (idx + 1) % 100 == 0:
-                    logger.info(f"Imported {idx + 1}/{len(df)} employees")
-                    
-            except Exception as e:
-                logger.error(f"Error importing row {idx}: {e}")
-                stats['errors'] += 1
-        
-        # Second pass: Update people leader relationships
-        logger.info("Second pass: Updating people leader relationships...")
-        self._update_people_leaders(df)
-        
-        # Third pass: Derive and import skills
-        logger.info("Third pass: Deriving skills...")
-        for email, emp_id in self.employee_cache.items():
-            employee = self.db.get_employee_by_id(emp_id)
-            if employee:
-                skills = self._derive_skills(employee)
-                for skill in skills:
+        # Employees, people leader links and skills are written in one transaction
+        # that holds the write lock from the start
+        with self.db.get_connection(immediate=True) as conn:
+            # First pass: Import all employees (without people leader FK)
+            logger.info("First pass: Importing employees...")
+            existing_emails = {
+                row['email_address'] for row in conn.execute("SELECT email_address FROM employees")
+            }
+
+            # Employees (and their role ownerships) are written every IMPORT_CHUNK_ROWS rows
+            # while the sheet streams; the new rows are indexed in one FTS rebuild instead
+            # of one trigger call per row
+            employees = []
+            chunk = []
+            with self.db.deferred_fts_sync():
+                for idx, row in enumerate(rows):
+                    stats['total_rows'] += 1
                     try:
-                        self.db.insert_skill(skill)
-                        stats['imported_skills'] += 1
+                        employee = self._row_to_employee(row)
+                        if employee.email_address in existing_emails:
+                            raise ValueError(f"Duplicate email address: {employee.email_address}")
+                        existing_emails.add(employee.email_address)
+                        chunk.append(employee)
                     except Exception as e:
-                        logger.error(f"Error inserting skill for {email}: {e}")
+                        logger.error(f"Error importing row {idx}: {e}")
+                        stats['errors'] += 1
+                    if len(chunk) >= self.IMPORT_CHUNK_ROWS:
+                        stats['imported_ownerships'] += self._insert_chunk(chunk)
+                        employees.extend(chunk)
+                        chunk = []
+                stats['imported_ownerships'] += self._insert_chunk(chunk)
+                employees.extend(chunk)
+
+            self._imported_employees = employees
+            stats['imported_employees'] = len(employees)
+            logger.info(f"Imported {len(employees)}/{stats['total_rows']} employees")
+
+            # Second pass: Update people leader relationships
+            logger.info("Second pass: Updating people leader relationships...")
+            self._update_people_leaders(employees)
+
+            # Third pass: Derive and import skills from the employees already in memory
+            logger.info("Third pass: Deriving skills...")
+            skills = self._derive_skills_parallel(self._imported_employees)
+            stats['imported_skills'] = self.db.insert_skills_bulk(skills)
         
         logger.info(f"Import completed: {stats}")
         return stats
     
-    def _row_to_employee(self, row: pd.Series) -> Employee:
-        """Convert Excel row to Employee object"""
+    def _insert_chunk(self, employees: List[Employee]) -> int:
+        """
+        Write a chunk of parsed employees, record their new IDs and derive their
+        role ownerships while the chunk's rows are fresh; returns ownerships written
+        """
+        if not employees:
+            return 0
+        employee_ids = self.db.insert_employees_bulk(employees)
+        for employee, employee_id in zip(employees, employee_ids):
+            employee.id = employee_id
+            self.employee_cache[employee.email_address] = employee_id
+        return self._derive_ownerships(min(employee_ids), max(employee_ids))
+
+    def _read_rows(self, excel_path: str):
+        """
+        Open the first sheet in openpyxl read-only mode and return an iterator of
+        row tuples in IMPORT_COLUMNS order (empty cells and missing optional columns as '')
+        Raises ValueError if a required column is missing
+        """
+        workbook = load_workbook(excel_path, read_only=True, data_only=True)
+        sheet_rows = workbook.worksheets[0].iter_rows(values_only=True)
+
+        # Normalize column names and validate required columns
+        header = [str(name).strip() if name is not None else '' for name in next(sheet_rows, ())]
+        required_cols = ['Formal Name', 'Email Address', 'Position Title']
+        missing_cols = [col for col in required_cols if col not in header]
+        if missing_cols:
+            workbook.close()
+            raise ValueError(f"Missing required columns: {missing_cols}")
+        positions = [header.index(col) if col in header else None for col in self.IMPORT_COLUMNS]
+
+        def rows():
+            try:
+                for values in sheet_rows:
+                    if all(value is None or value == '' for value in values):
+                        continue  # Blank line in the sheet
+                    yield tuple(
+                        '' if pos is None or pos >= len(values) or values[pos] is None else values[pos]
+                        for pos in positions
+                    )
+            finally:
+                workbook.close()
+
+        return rows()
+
+    def _row_to_employee(self, row: tuple) -> Employee:
+        """Convert an Excel row tuple (IMPORT_COLUMNS order) to Employee object"""
+        (formal_name, email, leader_name, position,
+         function, business_unit, team, location) = (str(value).strip() for value in row)
+
         return Employee(
-            formal_name=str(row.get('Formal Name', '')).strip(),
-            email_address=str(row.get('Email Address', '')).strip().lower(),
-            position_title=str(row.get('Position Title', '')).strip(),
-            function=str(row.get('Function (Label)', '')).strip() or None,
-            business_unit=str(row.get('Business Unit (Label)', '')).strip() or None,
-            team=str(row.get('Team (Label)', '')).strip() or None,
-            location=str(row.get('Location (Name)', '')).strip() or None,
-            people_leader_name=str(row.get('People Leader Formal Name', '')).strip() or None,
+            formal_name=formal_name,
+            email_address=email.lower(),
+            position_title=position,
+            function=function or None,
+            business_unit=business_unit or None,
+            team=team or None,
+            location=location or None,
+            people_leader_name=leader_name or None,
             is_active=True
         )
 
-    def _update_people_leaders(self, df: pd.DataFrame):
+    def _update_people_leaders(self, employees: List[Employee]):
         """Update people leader foreign keys after all employees are imported"""
-        for idx, row in df.iterrows():
-            email = str(row.get('Email Address', '')).strip().lower()
-            leader_name = str(row.get('People Leader Formal Name', '')).strip()
-
-            if email and leader_name and email in self.employee_cache:
-                # Find leader by name (approximate match)
-                leader = self._find_employee_by_name(leader_name)
-                if leader:
-                    # Update the employee's people_leader_id
-                    with self.db.get_connection() as conn:
-                        conn.execute("""
-                            UPDATE employees
-                            SET people_leader_id = ?
-                            WHERE id = ?
-                        """, (leader.id, self.employee_cache[email]))
-
-    def _find_employee_by_name(self, name: str) -> Employee:
-        """Find employee by name (fuzzy match)"""
-        with self.db.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM employees
-                WHERE formal_name LIKE ?
-                LIMIT 1
-            """, (f"%{name}%",))
-            row = cursor.fetchone()
-            if row:
-                return self.db._row_to_employee(row)
-        return None
+        links = [
+            (employee.email_address, employee.people_leader_name)
+            for employee in employees
+            if employee.people_leader_name
+        ]
+        linked = self.db.link_people_leaders(links)
+        logger.info(f"Linked {linked}/{len(links)} employees to their people leader")
 
     def _derive_skills(self, employee: Employee) -> List[EmployeeSkill]:
         """
         Derive skills from employee's position, team, and function
         Based on survey insight: don't rely on self-reported skills
         """
+        return self._derive_skills_batch([employee])
+
+    def _derive_skills_parallel(self, employees: List[Employee]) -> Iterable[EmployeeSkill]:
+        """
+        Derive skills shard by shard on worker threads. Only the calling thread
+        writes to the database, so workers never contend for the write lock.
+        Shard results are chained rather than concatenated; the caller still
+        builds its own list from them (insert_skills_bulk's parameter rows)
+        """
+        size = self.SKILL_SHARD_SIZE
+        if len(employees) <= size:
+            return self._derive_skills_batch(employees)
+
+        shards = [employees[i:i + size] for i in range(0, len(employees), size)]
+        with ThreadPoolExecutor(max_workers=min(len(shards), os.cpu_count() or 1)) as executor:
+            shard_skills = list(executor.map(self._derive_skills_batch, shards))
+        return chain.from_iterable(shard_skills)
+
+    def _derive_skills_batch(self, employees: List[Employee]) -> List[EmployeeSkill]:
+        """
+        Derive skills for many employees with a single regex scan over all of
+        their texts (one line per employee), mapping matches back by offset
+        """
+        texts = [
+            ' '.join(filter(None, [employee.position_title, employee.team, employee.function])).lower()
+            for employee in employees
+        ]
+        line_starts = []
+        offset = 0
+        for text in texts:
+            line_starts.append(offset)
+            offset += len(text) + 1
+
+        found: List[Set[str]] = [set() for _ in employees]
+        for start, pattern in self._skill_matches('\n'.join(texts)):
+            found[bisect_right(line_starts, start) - 1].add(pattern)
+
         skills = []
-        text_to_analyze = ' '.join(filter(None, [
-            employee.position_title,
-            employee.team,
-            employee.function
-        ])).lower()
+        for employee, employee_found in zip(employees, found):
+            if employee_found:
+                skills.extend(self._skills_from_matches(employee, employee_found))
+        return skills
+
+    def _skill_matches(self, text: str):
+        """Yield (start offset, pattern) for every word-bounded skill pattern in text"""
+        if self._SKILL_AUTOMATON is None:
+            for match in self._SKILL_RE.finditer(text):
+                yield match.start(), match.group(1)
+            return
 
-        # Extract skills using pattern matching
+        # Same word boundaries as the regex's \b (patterns start and end with word characters)
+        last = len(text) - 1
+        for end, pattern in self._SKILL_AUTOMATON.iter(text):
+            start = end - len(pattern) + 1
+            if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                continue
+            if end < last and (text[end + 1].isalnum() or text[end + 1] == '_'):
+                continue
+            yield start, pattern
+
+    def _skills_from_matches(self, employee: Employee, found: Set[str]) -> List[EmployeeSkill]:
+        """Build skill records for the patterns found in an employee's text"""
+        skills = []
         for skill_name, patterns in self.SKILL_PATTERNS.items():
             for pattern in patterns:
-                if re.search(r'\b' + re.escape(pattern) + r'\b', text_to_analyze):
+                if pattern in found:
                     # Determine source and confidence
                     source = 'position_title'
                     confidence = 0.7
@@ -211,20 +388,7 @@ class ExcelImporter:
 
     def _categorize_skill(self, skill_name: str) -> str:
         """Categorize skill into broad categories"""
-        technical_skills = {'provisioning', 'network', 'cloud', 'security', 'database',
-                           'devops', 'api', 'mobile', 'web'}
-        domain_skills = {'sales', 'compliance', 'product', 'engineering', 'support',
-                        'analytics', 'project management'}
-        process_skills = {'bia', 'billing', 'crm', 'procurement'}
-
-        if skill_name in technical_skills:
-            return 'Technical'
-        elif skill_name in domain_skills:
-            return 'Domain'
-        elif skill_name in process_skills:
-            return 'Process'
-        else:
-            return 'Other'
+        return self._SKILL_CATEGORY.get(skill_name, 'Other')
 
     def derive_role_ownerships(self):
         """
@@ -233,52 +397,17 @@ class ExcelImporter:
         """
         logger.info("Deriving role ownerships...")
 
-        # Common responsibility patterns
-        ownership_patterns = {
-            'provisioning': ['provisioning', 'provision'],
-            'network setup': ['network', 'infrastructure'],
-            'security compliance': ['security', 'compliance', 'risk'],
-            'customer support': ['support', 'service desk', 'helpdesk'],
-            'billing operations': ['billing', 'invoice'],
-            'product management': ['product manager', 'product owner'],
-            'project delivery': ['project manager', 'programme'],
-        }
+        count = self._derive_ownerships(1, _MAX_ROWID)
+
+        logger.info(f"Derived {count} role ownerships")
+        return count
 
+    def _derive_ownerships(self, first_id: int, last_id: int) -> int:
+        """Run the ownership statements for employees with ids in [first_id, last_id]"""
         count = 0
         with self.db.get_connection() as conn:
-            cursor = conn.execute("SELECT * FROM employees WHERE is_active = 1")
-            employees = [self.db._row_to_employee(row) for row in cursor.fetchall()]
-
-        for employee in employees:
-            position_lower = employee.position_title.lower()
-
-            for responsibility, patterns in ownership_patterns.items():
-                for pattern in patterns:
-                    if pattern in position_lower:
-                        # Determine ownership type
-                        ownership_type = 'primary'
-                        if 'lead' in position_lower or 'manager' in position_lower:
-                            ownership_type = 'primary'
-                        elif 'senior' in position_lower:
-                            ownership_type = 'primary'
-                        elif 'junior' in position_lower or 'assistant' in position_lower:
-                            ownership_type = 'backup'
-
-                        ownership = RoleOwnership(
-                            employee_id=employee.id,
-                            responsibility_area=responsibility,
-                            ownership_type=ownership_type,
-                            team=employee.team
-                        )
-
-                        try:
-                            self.db.insert_role_ownership(ownership)
-                            count += 1
-                        except Exception as e:
-                            logger.error(f"Error inserting ownership: {e}")
-
-                        break  # Only one ownership per responsibility
-
-        logger.info(f"Derived {count} role ownerships")
+            self.db._data_changed()
+            for sql, params in self._OWNERSHIP_STATEMENTS:
+                count += conn.execute(sql, (*params, first_id, last_id)).rowcount
         return count
 
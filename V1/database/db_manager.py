@@ -3,46 +3,376 @@ Database manager for Company Employee Directory
 """
 import sqlite3
 import os
-from typing import List, Optional, Dict, Any
+import threading
+import weakref
+import zlib
+from time import monotonic
+from typing import List, Optional, Dict, Any, Tuple, Callable, Iterable
 from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 from .models import Employee, EmployeeSkill, RoleOwnership, QueryLog
 
 
+# Set once per pooled connection when it is opened: no fsync on every commit (safe
+# under WAL), a 64 MB page cache, in-memory temp tables, mmap reads and FK enforcement
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Prepared statements kept per pooled connection (sqlite3 default: 128). The SQL
+# constants below, the 32 criteria variants and the per-size batch statements
+# all stay compiled alongside each other
+STATEMENT_CACHE_SIZE = 256
+
+# Lifetime of the read caches. Commits made through this manager clear them right
+# away; writes from other processes (imports, mock loads) or raw SQL show up
+# within this many seconds
+READ_CACHE_TTL_SECONDS = 60
+
+
+# Schema DDL, read once per process. Its checksum is stored as the database's
+# user_version, so a file already on this schema skips the script entirely
+_SCHEMA_SQL = (Path(__file__).parent / "schema.sql").read_text()
+_SCHEMA_VERSION = zlib.crc32(_SCHEMA_SQL.encode()) & 0x7FFFFFFF
+
+# Statement text shared by every call, so each variant is parsed and planned once
+# per pooled connection and then served from its statement cache
+_SQL_INSERT_EMPLOYEE = """
+    INSERT INTO employees (
+        formal_name, email_address, position_title, function,
+        business_unit, team, location, people_leader_id, is_active
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# INSERT ... RETURNING needs SQLite 3.35+. Rows per multi-row INSERT keep the
+# 9 parameters each under the historical 999-variable limit
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_INSERT_CHUNK_ROWS = 100
+
+
+@lru_cache(maxsize=None)
+def _insert_employees_returning_sql(row_count: int) -> str:
+    """Multi-row employee INSERT returning (id, email_address) per new row"""
+    head, values = _SQL_INSERT_EMPLOYEE.rsplit("VALUES", 1)
+    return f"{head}VALUES {', '.join([values.strip()] * row_count)} RETURNING id, email_address"
+
+
+@lru_cache(maxsize=None)
+def _update_leaders_sql(row_count: int) -> str:
+    """One UPDATE setting people_leader_id for row_count employees via CASE id"""
+    whens = ' '.join(['WHEN ? THEN ?'] * row_count)
+    ids = ', '.join(['?'] * row_count)
+    return f"UPDATE employees SET people_leader_id = CASE id {whens} END WHERE id IN ({ids})"
+
+
+_SQL_INSERT_SKILL = """
+    INSERT OR REPLACE INTO employee_skills (
+        employee_id, skill_name, skill_category, confidence_score, source
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_OWNERSHIP = """
+    INSERT INTO role_ownership (
+        employee_id, responsibility_area, ownership_type, team, is_active
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_GET_BY_EMAIL = "SELECT * FROM employees WHERE email_address = ? AND is_active = 1"
+_SQL_GET_BY_ID = "SELECT * FROM employees WHERE id = ? AND is_active = 1"
+
+# search_employees_by_criteria: one fixed statement per combination of filters,
+# keyed by bitmask (1 = team, 2 = function, 4 = business_unit, 8 = position_title)
+_CRITERIA_COLUMNS = ('team', 'function', 'business_unit', 'position_title')
+_SQL_CRITERIA = {
+    mask: "SELECT * FROM employees WHERE is_active = 1" + "".join(
+        f" AND {column} LIKE ?"
+        for bit, column in enumerate(_CRITERIA_COLUMNS) if mask & (1 << bit)
+    ) + " LIMIT ?"
+    for mask in range(1 << len(_CRITERIA_COLUMNS))
+}
+# Same filters, but candidates come from an employees_fts MATCH; the LIKEs then
+# only verify those rows instead of scanning the table
+_SQL_CRITERIA_FTS = {
+    mask: "SELECT * FROM employees WHERE id IN ("
+          "SELECT rowid FROM employees_fts WHERE employees_fts MATCH ?"
+          ") AND is_active = 1" + sql[len("SELECT * FROM employees WHERE is_active = 1"):]
+    for mask, sql in _SQL_CRITERIA.items()
+}
+
+
+# Compact employee dicts for callers that only serialize results (the agent tools):
+# EMPLOYEE_DICT_KEYS[i] holds EMPLOYEE_DICT_FIELDS[i], which names both the employees
+# column and the Employee attribute
+EMPLOYEE_DICT_KEYS = ('id', 'name', 'email', 'position', 'team', 'function', 'business_unit', 'location')
+EMPLOYEE_DICT_FIELDS = (
+    'id', 'formal_name', 'email_address', 'position_title',
+    'team', 'function', 'business_unit', 'location'
+)
+_employee_dict_fields = itemgetter(*EMPLOYEE_DICT_FIELDS)
+
+
+# Special FTS5 characters that might cause syntax errors (anything else, e.g. '-',
+# is literal inside the quoted terms built below)
+_FTS_STRIP_TABLE = str.maketrans('', '', '"?*()')
+
+
+@lru_cache(maxsize=512)
+def _build_fts_query(raw: str) -> str:
+    """
+    Turn a user query into an FTS5 expression: words joined with OR, each as a
+    prefix term ("auck" finds "Auckland"). Case and word order don't change the
+    match, so they are normalized for the search cache. Empty if nothing is left
+    """
+    words = sorted(raw.translate(_FTS_STRIP_TABLE).lower().split())
+    if not words:
+        return ''
+    return '"' + '"* OR "'.join(words) + '"*'
+
+
+def _ttl_lru_cache(func: Callable, maxsize: int, ttl: float = READ_CACHE_TTL_SECONDS) -> Callable:
+    """
+    lru_cache whose entries are all dropped once ttl seconds have passed since the
+    last reset, so nothing is served more than ttl seconds old. Exposes cache_clear()
+    """
+    cached = lru_cache(maxsize=maxsize)(func)
+    expires_at = monotonic() + ttl
+
+    def wrapper(*args):
+        nonlocal expires_at
+        now = monotonic()
+        if now >= expires_at:
+            cached.cache_clear()
+            expires_at = now + ttl
+        return cached(*args)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _close_connections(connections: List[sqlite3.Connection]) -> int:
+    """Close and remove every connection in the list, returns how many were closed"""
+    closed = len(connections)
+    while connections:
+        connections.pop().close()
+    return closed
+
+
 class DatabaseManager:
     """Manages SQLite database operations"""
     
-    def __init__(self, db_path: str = "data/employee_directory.db"):
+    def __init__(self, db_path: str = "data/employee_directory.db", pool_size: Optional[int] = None):
+        """
+        Args:
+            db_path: SQLite file (or ":memory:")
+            pool_size: Max open connections, default os.cpu_count(). An in-memory
+                database is private to its connection, so it always gets one
+        """
         self.db_path = db_path
+        if db_path == ":memory:":
+            pool_size = 1
+        self._pool_size = pool_size or os.cpu_count() or 1
+        self._idle: List[sqlite3.Connection] = []  # Returned connections, most recent last
+        self._opened = 0  # Connections created so far (at most _pool_size)
+        self._pool_cond = threading.Condition()
+        # Close idle connections at interpreter exit (or when the manager is collected)
+        weakref.finalize(self, _close_connections, self._idle)
+        self._local = threading.local()  # Checked-out and last-used connection per thread
+        self._write_listeners: List[Callable[[], None]] = []  # Notified after employee data commits
+        # Read caches keyed on normalized query arguments; rows are cached, Employees built per call.
+        # Cleared on in-process writes and expired after READ_CACHE_TTL_SECONDS
+        self._fulltext_rows = _ttl_lru_cache(self._query_fulltext, maxsize=1024)
+        self._skill_rows = _ttl_lru_cache(self._query_skill, maxsize=1024)
+        # Leaders are looked up once per report, so id lookups repeat heavily
+        self._employee_row = _ttl_lru_cache(self._query_employee_by_id, maxsize=2048)
+        # Agent conversations repeat the same email and team lookups across turns
+        self._email_row = _ttl_lru_cache(self._query_employee_by_email, maxsize=1024)
+        self._criteria_rows = _ttl_lru_cache(self._query_criteria, maxsize=1024)
+        self.add_write_listener(self.cache_clear)
         self._ensure_db_directory()
+        self._bootstrap_database()
         self._initialize_database()
     
     def _ensure_db_directory(self):
         """Create database directory if it doesn't exist"""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
     
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
+    def _bootstrap_database(self):
+        """Switch the database file to WAL; the journal mode persists for every later connection"""
         conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
         try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+
+    def _checkout(self) -> sqlite3.Connection:
+        """
+        Take an idle pooled connection, preferring the one this thread used last
+        (its page cache holds this worker's recent lookups). Opens a new one while
+        below pool_size, else waits for a connection to be returned
+        """
+        preferred = getattr(self._local, 'last_conn', None)
+        conn = None
+        with self._pool_cond:
+            while True:
+                if preferred is not None and any(idle is preferred for idle in self._idle):
+                    self._idle.remove(preferred)
+                    conn = preferred
+                    break
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._opened < self._pool_size:
+                    self._opened += 1
+                    break
+                self._pool_cond.wait()
+
+        if conn is None:
+            try:
+                conn = self._open_connection()
+            except BaseException:
+                # Give the reserved slot back, or the pool shrinks for good
+                with self._pool_cond:
+                    self._opened -= 1
+                    self._pool_cond.notify()
+                raise
+        return conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new pooled connection"""
+        # check_same_thread=False: connections move between worker threads via the pool
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        try:
+            conn.row_factory = sqlite3.Row  # Enable column access by name
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _checkin(self, conn: sqlite3.Connection):
+        """
+        Return a connection to the pool and remember it as this thread's last one
+        A transaction still open here (the block was interrupted) is rolled back so
+        the next borrower never inherits it
+        """
+        if conn.in_transaction:
+            conn.rollback()
+        self._local.last_conn = conn
+        with self._pool_cond:
+            self._idle.append(conn)
+            self._pool_cond.notify()
+
+    @contextmanager
+    def get_connection(self, immediate: bool = False):
+        """
+        Context manager for database connections
+        Connections are long-lived and shared through a bounded pool, so prepared
+        statements and the page cache survive between calls. A connection is held
+        exclusively until its outermost block exits; nested calls on the same thread
+        join that transaction, and only the outermost block commits or rolls back
+
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE) for batch writes
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._checkout()
+        self._local.conn = conn
+        try:
+            if immediate:
+                conn.execute("BEGIN IMMEDIATE")
             yield conn
             conn.commit()
-        except Exception as e:
+            if getattr(self._local, 'data_changed', False):
+                for listener in self._write_listeners:
+                    listener()
+        except BaseException:
             conn.rollback()
-            raise e
+            raise
         finally:
-            conn.close()
+            self._local.conn = None
+            self._local.data_changed = False
+            self._checkin(conn)
+
+    def close(self):
+        """Close the idle pooled connections (new ones are opened on next use)"""
+        with self._pool_cond:
+            self._opened -= _close_connections(self._idle)
+
+    def add_write_listener(self, callback: Callable[[], None]):
+        """Register a callback run after each commit that changed employee data (cache invalidation)"""
+        self._write_listeners.append(callback)
+
+    def _data_changed(self):
+        """Flag the current transaction as a write to employee data; listeners fire on commit"""
+        self._local.data_changed = True
     
     def _initialize_database(self):
-        """Initialize database schema"""
-        schema_path = Path(__file__).parent / "schema.sql"
-        
+        """Initialize database schema (skipped if the file is already on the current schema)"""
+        with self.get_connection() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+                return
+            rebuild_fts = self._drop_outdated_fts(conn)
+            conn.executescript(_SCHEMA_SQL)
+            if rebuild_fts:
+                conn.execute("INSERT INTO employees_fts(employees_fts) VALUES('rebuild')")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _drop_outdated_fts(self, conn: sqlite3.Connection) -> bool:
+        """
+        Drop FTS objects created by older schema versions so the schema recreates them
+        Returns True if the index has to be rebuilt
+        """
+        rebuild = False
+
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'employees_fts'").fetchone()
+        if row and 'remove_diacritics' not in row['sql']:
+            conn.execute("DROP TABLE employees_fts")
+            rebuild = True
+
+        # Older sync triggers deleted/updated the external-content index directly,
+        # which leaves stale entries behind
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'employees_au'").fetchone()
+        if row and "'delete'" not in row['sql']:
+            conn.execute("DROP TRIGGER IF EXISTS employees_ad")
+            conn.execute("DROP TRIGGER IF EXISTS employees_au")
+            rebuild = True
+
+        return rebuild
+
+    @contextmanager
+    def deferred_fts_sync(self):
+        """
+        Suspend the employees_fts insert trigger for a bulk load and rebuild the
+        index once at the end. Runs inside the caller's transaction, so a failed
+        load also restores the trigger
+        """
         with self.get_connection() as conn:
-            with open(schema_path, 'r') as f:
-                conn.executescript(f.read())
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'employees_ai'"
+            ).fetchone()
+            conn.execute("DROP TRIGGER IF EXISTS employees_ai")
+
+            yield conn
+
+            conn.execute("INSERT INTO employees_fts(employees_fts) VALUES('rebuild')")
+            if row:
+                conn.execute(row['sql'])
     
     # ============================================
     # Employee Operations
@@ -51,75 +381,175 @@ class DatabaseManager:
     def insert_employee(self, employee: Employee) -> int:
         """Insert a new employee and return the ID"""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO employees (
-                    formal_name, email_address, position_title, function,
-                    business_unit, team, location, people_leader_id, is_active
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            self._data_changed()
+            cursor = conn.execute(_SQL_INSERT_EMPLOYEE, (
                 employee.formal_name, employee.email_address, employee.position_title,
                 employee.function, employee.business_unit, employee.team,
                 employee.location, employee.people_leader_id, employee.is_active
             ))
             return cursor.lastrowid
 
+    def insert_employees_bulk(self, employees: List[Employee]) -> List[int]:
+        """Insert many employees in a single transaction and return their IDs (input order)"""
+        rows = [
+            (
+                e.formal_name, e.email_address, e.position_title,
+                e.function, e.business_unit, e.team,
+                e.location, e.people_leader_id, e.is_active
+            )
+            for e in employees
+        ]
+
+        with self.get_connection() as conn:
+            self._data_changed()
+            if _HAS_RETURNING:
+                # Multi-row INSERT ... RETURNING hands back the new ids directly
+                # (executemany discards RETURNING rows); RETURNING order is
+                # unspecified, so ids are matched back by email
+                id_by_email = {}
+                for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+                    chunk = rows[start:start + _INSERT_CHUNK_ROWS]
+                    cursor = conn.execute(
+                        _insert_employees_returning_sql(len(chunk)),
+                        [value for row in chunk for value in row]
+                    )
+                    id_by_email.update((row['email_address'], row['id']) for row in cursor)
+            else:
+                last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM employees").fetchone()[0]
+                conn.executemany(_SQL_INSERT_EMPLOYEE, rows)
+                cursor = conn.execute("""
+                    SELECT id, email_address FROM employees WHERE id > ?
+                """, (last_id,))
+                id_by_email = {row['email_address']: row['id'] for row in cursor}
+
+        return [id_by_email[e.email_address] for e in employees]
+
     def update_employee_leader(self, employee_id: int, leader_id: int) -> bool:
         """Update employee's people leader"""
         with self.get_connection() as conn:
+            self._data_changed()
             conn.execute("""
                 UPDATE employees SET people_leader_id = ? WHERE id = ?
             """, (leader_id, employee_id))
             return True
     
+    def update_employee_leaders(self, links: List[Tuple[int, int]]) -> int:
+        """
+        Set many people leaders with one CASE UPDATE per chunk of rows
+        links: (employee id, leader id) pairs; returns the number of rows updated
+        """
+        updated = 0
+        with self.get_connection() as conn:
+            self._data_changed()
+            for start in range(0, len(links), _INSERT_CHUNK_ROWS):
+                chunk = links[start:start + _INSERT_CHUNK_ROWS]
+                params = [value for link in chunk for value in link]
+                params.extend(employee_id for employee_id, _ in chunk)
+                updated += conn.execute(_update_leaders_sql(len(chunk)), params).rowcount
+        return updated
+
+    def link_people_leaders(self, links: List[Tuple[str, str]]) -> int:
+        """
+        Resolve people leaders by name and set their FKs in one batched UPDATE
+        links: (employee email, people leader formal name) pairs
+        Names are matched case-insensitively against a map loaded in one scan;
+        only names missing from it fall back to a LIKE '%name%' lookup, once per
+        distinct name (misses included), not once per report
+        Returns the number of employees linked to a leader
+        """
+        with self.get_connection() as conn:
+            self._data_changed()
+            name_map: Dict[str, int] = {}
+            for row in conn.execute("SELECT id, formal_name FROM employees ORDER BY id"):
+                name_map.setdefault(row['formal_name'].strip().lower(), row['id'])
+
+            fallback: Dict[str, Optional[int]] = {}  # LIKE results by leader name, None = no match
+            updates = []
+            for email, leader_name in links:
+                leader_id = name_map.get(leader_name.strip().lower())
+                if leader_id is None:
+                    if leader_name not in fallback:
+                        row = conn.execute(
+                            "SELECT id FROM employees WHERE formal_name LIKE ? LIMIT 1",
+                            (f"%{leader_name}%",)
+                        ).fetchone()
+                        fallback[leader_name] = row['id'] if row else None
+                    leader_id = fallback[leader_name]
+                    if leader_id is None:
+                        continue
+                updates.append((leader_id, email))
+
+            conn.executemany(
+                "UPDATE employees SET people_leader_id = ? WHERE email_address = ?", updates
+            )
+            return len(updates)
+
     def get_employee_by_email(self, email: str) -> Optional[Employee]:
         """Get employee by email address"""
+        row = self._email_row(email)
+        if row:
+            return self._row_to_employee(row)
+        return None
+
+    def _query_employee_by_email(self, email: str) -> Optional[sqlite3.Row]:
+        """Fetch one active employee row by email (memoized as _email_row)"""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM employees WHERE email_address = ? AND is_active = 1
-            """, (email,))
-            row = cursor.fetchone()
-            
-            if row:
-                return self._row_to_employee(row)
-            return None
+            return conn.execute(_SQL_GET_BY_EMAIL, (email,)).fetchone()
     
     def get_employee_by_id(self, employee_id: int) -> Optional[Employee]:
         """Get employee by ID"""
+        row = self._employee_row(employee_id)
+        if row:
+            return self._row_to_employee(row)
+        return None
+
+    def _query_employee_by_id(self, employee_id: int) -> Optional[sqlite3.Row]:
+        """Fetch one active employee row (memoized as _employee_row)"""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM employees WHERE id = ? AND is_active = 1
-            """, (employee_id,))
-            row = cursor.fetchone()
-            
-            if row:
-                return self._row_to_employee(row)
-            return None
+            return conn.execute(_SQL_GET_BY_ID, (employee_id,)).fetchone()
     
     def search_employees_fulltext(self, query: str, limit: int = 20) -> List[Employee]:
-        """Full-text search across employee data"""
-        # Escape FTS5 special characters and prepare query
-        # Remove special FTS5 characters that might cause syntax errors
-        fts_query = query.replace('"', '').replace('?', '').replace('*', '').replace('(', '').replace(')', '')
-        # Split into words and join with OR
-        words = fts_query.split()
-        if not words:
-            return []
-        fts_query = ' OR '.join(f'"{word}"' for word in words)
+        """Full-text search across employee data, best bm25 matches first"""
+        return [self._row_to_employee(row) for row in self._search_fulltext_rows(query, limit)]
 
+    def search_employees_fulltext_dicts(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Same search as compact employee dicts (EMPLOYEE_DICT_KEYS) for JSON-only callers"""
+        return [self._row_to_dict(row) for row in self._search_fulltext_rows(query, limit)]
+
+    def _search_fulltext_rows(self, query: str, limit: int) -> Tuple[sqlite3.Row, ...]:
+        """Sanitize the user query into an FTS5 expression and fetch the matching rows"""
+        fts_query = _build_fts_query(query)
+        if not fts_query:
+            return ()
+
+        try:
+            rows = self._fulltext_rows(fts_query, limit)
+        except Exception as e:
+            print(f"FTS5 search error: {e}, query: {fts_query}")
+            return ()
+        return rows
+
+    def _query_fulltext(self, fts_query: str, limit: int) -> Tuple[sqlite3.Row, ...]:
+        """Run an FTS5 MATCH query (memoized as _fulltext_rows)"""
         with self.get_connection() as conn:
-            try:
-                cursor = conn.execute("""
-                    SELECT e.* FROM employees e
-                    JOIN employees_fts fts ON e.id = fts.rowid
+            # Resolve the FTS5 match in a CTE before joining so the planner always
+            # drives from the full-text index; overfetch to leave room for the
+            # is_active filter, then re-limit
+            cursor = conn.execute("""
+                WITH fts AS (
+                    SELECT rowid, rank AS score  -- rank is bm25() by default
+                    FROM employees_fts
                     WHERE employees_fts MATCH ?
-                    AND e.is_active = 1
+                    ORDER BY rank
                     LIMIT ?
-                """, (fts_query, limit))
-
-                return [self._row_to_employee(row) for row in cursor.fetchall()]
-            except Exception as e:
-                print(f"FTS5 search error: {e}, query: {fts_query}")
-                return []
+                )
+                SELECT e.* FROM fts
+                JOIN employees e ON e.id = fts.rowid
+                WHERE e.is_active = 1
+                ORDER BY fts.score
+                LIMIT ?
+            """, (fts_query, limit * 5, limit))
+            return tuple(cursor.fetchall())
     
     def search_employees_by_criteria(
         self, 
@@ -127,34 +557,64 @@ class DatabaseManager:
         function: Optional[str] = None,
         business_unit: Optional[str] = None,
         position_keywords: Optional[str] = None,
-        limit: int = 50
-    ) -> List[Employee]:
-        """Search employees by specific criteria"""
-        query = "SELECT * FROM employees WHERE is_active = 1"
+        limit: int = 50,
+        as_dicts: bool = False
+    ) -> List[Any]:
+        """
+        Search employees by specific criteria
+        Candidates come from the FTS index, so each value has to match from the start
+        of a word ("infra" finds "Network Infrastructure", "work" does not); a value
+        with no indexable word falls back to a plain substring scan
+        as_dicts=True returns compact employee dicts (EMPLOYEE_DICT_KEYS) instead of Employees
+        """
+        rows = self._criteria_rows(team or None, function or None, business_unit or None,
+                                   position_keywords or None, limit)
+        convert = self._row_to_dict if as_dicts else self._row_to_employee
+        return [convert(row) for row in rows]
+
+    def _query_criteria(
+        self,
+        team: Optional[str],
+        function: Optional[str],
+        business_unit: Optional[str],
+        position_keywords: Optional[str],
+        limit: int
+    ) -> Tuple[sqlite3.Row, ...]:
+        """Run the criteria search query (memoized as _criteria_rows)"""
+        values = (team, function, business_unit, position_keywords)
+        mask = 0
         params = []
-        
-        if team:
-            query += " AND team LIKE ?"
-            params.append(f"%{team}%")
-        
-        if function:
-            query += " AND function LIKE ?"
-            params.append(f"%{function}%")
-        
-        if business_unit:
-            query += " AND business_unit LIKE ?"
-            params.append(f"%{business_unit}%")
-        
-        if position_keywords:
-            query += " AND position_title LIKE ?"
-            params.append(f"%{position_keywords}%")
-        
-        query += " LIMIT ?"
+        for bit, value in enumerate(values):
+            if value:
+                mask |= 1 << bit
+                params.append(f"%{value}%")
         params.append(limit)
-        
+
+        sql = _SQL_CRITERIA[mask]
+        if mask:
+            fts_query = self._criteria_fts_query(values)
+            if fts_query:
+                sql = _SQL_CRITERIA_FTS[mask]
+                params.insert(0, fts_query)
+
         with self.get_connection() as conn:
-            cursor = conn.execute(query, params)
-            return [self._row_to_employee(row) for row in cursor.fetchall()]
+            return tuple(conn.execute(sql, params).fetchall())
+
+    @staticmethod
+    def _criteria_fts_query(values: Tuple[Optional[str], ...]) -> Optional[str]:
+        """
+        FTS5 column filters for the set criteria, e.g. team:"network infra"*
+        None if a value has no indexable word (the LIKE scan handles it)
+        """
+        terms = []
+        for column, value in zip(_CRITERIA_COLUMNS, values):
+            if not value:
+                continue
+            phrase = ' '.join(value.replace('"', ' ').split())
+            if not any(ch.isalnum() for ch in phrase):
+                return None
+            terms.append(f'{column}:"{phrase}"*')
+        return ' AND '.join(terms)
 
     # ============================================
     # Skills Operations
@@ -163,18 +623,39 @@ class DatabaseManager:
     def insert_skill(self, skill: EmployeeSkill) -> int:
         """Insert employee skill"""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT OR REPLACE INTO employee_skills (
-                    employee_id, skill_name, skill_category, confidence_score, source
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
+            self._data_changed()
+            cursor = conn.execute(_SQL_INSERT_SKILL, (
                 skill.employee_id, skill.skill_name, skill.skill_category,
                 skill.confidence_score, skill.source
             ))
             return cursor.lastrowid
 
-    def get_employees_by_skill(self, skill_name: str, min_confidence: float = 0.3) -> List[Employee]:
-        """Find employees with a specific skill"""
+    def insert_skills_bulk(self, skills: Iterable[EmployeeSkill]) -> int:
+        """Insert many employee skills in a single transaction, returns the number written"""
+        rows = [
+            (s.employee_id, s.skill_name, s.skill_category, s.confidence_score, s.source)
+            for s in skills
+        ]
+
+        with self.get_connection() as conn:
+            self._data_changed()
+            conn.executemany(_SQL_INSERT_SKILL, rows)
+        return len(rows)
+
+    def get_employees_by_skill(
+        self,
+        skill_name: str,
+        min_confidence: float = 0.3,
+        as_dicts: bool = False
+    ) -> List[Any]:
+        """Find employees with a specific skill (compact dicts with as_dicts=True)"""
+        # LIKE is case-insensitive, so the lowercased name is an equivalent cache key
+        rows = self._skill_rows(skill_name.lower(), min_confidence)
+        convert = self._row_to_dict if as_dicts else self._row_to_employee
+        return [convert(row) for row in rows]
+
+    def _query_skill(self, skill_name: str, min_confidence: float) -> Tuple[sqlite3.Row, ...]:
+        """Run the skill lookup query (memoized as _skill_rows)"""
         with self.get_connection() as conn:
             cursor = conn.execute("""
                 SELECT e.* FROM employees e
@@ -182,10 +663,22 @@ class DatabaseManager:
                 WHERE es.skill_name LIKE ?
                 AND es.confidence_score >= ?
                 AND e.is_active = 1
-                ORDER BY es.confidence_score DESC
+                -- Ties: every name contains the query, so the shortest is the closest
+                -- match (an exact match is the shortest possible)
+                ORDER BY es.confidence_score DESC, length(es.skill_name)
             """, (f"%{skill_name}%", min_confidence))
+            return tuple(cursor.fetchall())
 
-            return [self._row_to_employee(row) for row in cursor.fetchall()]
+    def cache_clear(self):
+        """
+        Drop memoized search results (runs after every commit through this manager
+        that changed employee data; other writers are covered by the TTL)
+        """
+        self._fulltext_rows.cache_clear()
+        self._skill_rows.cache_clear()
+        self._employee_row.cache_clear()
+        self._email_row.cache_clear()
+        self._criteria_rows.cache_clear()
 
     # ============================================
     # Role Ownership Operations
@@ -194,18 +687,37 @@ class DatabaseManager:
     def insert_role_ownership(self, ownership: RoleOwnership) -> int:
         """Insert role ownership record"""
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO role_ownership (
-                    employee_id, responsibility_area, ownership_type, team, is_active
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
+            self._data_changed()
+            cursor = conn.execute(_SQL_INSERT_OWNERSHIP, (
                 ownership.employee_id, ownership.responsibility_area,
                 ownership.ownership_type, ownership.team, ownership.is_active
             ))
             return cursor.lastrowid
 
-    def get_owners_by_responsibility(self, responsibility: str) -> List[Dict[str, Any]]:
-        """Get employees responsible for a specific area (with ownership type)"""
+    def insert_role_ownerships_bulk(self, ownerships: Iterable[RoleOwnership]) -> int:
+        """Insert many role ownership records in a single transaction, returns the number written"""
+        rows = [
+            (o.employee_id, o.responsibility_area, o.ownership_type, o.team, o.is_active)
+            for o in ownerships
+        ]
+
+        with self.get_connection() as conn:
+            self._data_changed()
+            conn.executemany(_SQL_INSERT_OWNERSHIP, rows)
+        return len(rows)
+
+    def get_owners_by_responsibility(
+        self,
+        responsibility: str,
+        limit: Optional[int] = None,
+        as_dicts: bool = False
+    ) -> List[Any]:
+        """
+        Get employees responsible for a specific area (with ownership type)
+        Primary owners come first, then backups and escalations; limit caps the rows in SQL
+        Returns (employee, ownership_type, responsibility_area) tuples, or with
+        as_dicts=True flat compact employee dicts with the ownership fields added
+        """
         with self.get_connection() as conn:
             cursor = conn.execute("""
                 SELECT e.*, ro.ownership_type, ro.responsibility_area
@@ -221,18 +733,21 @@ class DatabaseManager:
                         WHEN 'escalation' THEN 3
                         ELSE 4
                     END
-            """, (f"%{responsibility}%",))
+                LIMIT ?
+            """, (f"%{responsibility}%", -1 if limit is None else limit))
+            rows = cursor.fetchall()
 
+        # The two ownership columns are the last ones selected
+        if as_dicts:
             results = []
-            for row in cursor.fetchall():
-                employee = self._row_to_employee(row)
-                results.append({
-                    'employee': employee,
-                    'ownership_type': row['ownership_type'],
-                    'responsibility_area': row['responsibility_area']
-                })
+            for row in rows:
+                owner = self._row_to_dict(row)
+                owner['ownership_type'], owner['responsibility_area'] = row[-2:]
+                results.append(owner)
             return results
 
+        return [(self._row_to_employee(row), *row[-2:]) for row in rows]
+
     # ============================================
     # Query Logging
     # ============================================
@@ -256,36 +771,34 @@ class DatabaseManager:
     # ============================================
 
     def _row_to_employee(self, row: sqlite3.Row) -> Employee:
-        """Convert database row to Employee object"""
+        """Convert database row to Employee object (positional, in field order)"""
         return Employee(
-            id=row['id'],
-            formal_name=row['formal_name'],
-            email_address=row['email_address'],
-            position_title=row['position_title'],
-            function=row['function'],
-            business_unit=row['business_unit'],
-            team=row['team'],
-            location=row['location'],
-            people_leader_id=row['people_leader_id'],
-            is_active=bool(row['is_active'])
+            row['formal_name'],
+            row['email_address'],
+            row['position_title'],
+            row['function'],
+            row['business_unit'],
+            row['team'],
+            row['location'],
+            None,  # people_leader_name
+            row['people_leader_id'],
+            bool(row['is_active']),
+            row['id'],
         )
 
+    def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert database row straight to a compact employee dict (no Employee object)"""
+        return dict(zip(EMPLOYEE_DICT_KEYS, _employee_dict_fields(row)))
+
     def get_statistics(self) -> Dict[str, Any]:
-        """Get database statistics"""
+        """Get database statistics (one query, one pass over employees)"""
         with self.get_connection() as conn:
-            stats = {}
-
-            # Total employees
-            cursor = conn.execute("SELECT COUNT(*) as count FROM employees WHERE is_active = 1")
-            stats['total_employees'] = cursor.fetchone()['count']
-
-            # Total teams
-            cursor = conn.execute("SELECT COUNT(DISTINCT team) as count FROM employees WHERE is_active = 1")
-            stats['total_teams'] = cursor.fetchone()['count']
-
-            # Total queries logged
-            cursor = conn.execute("SELECT COUNT(*) as count FROM query_log")
-            stats['total_queries'] = cursor.fetchone()['count']
-
-            return stats
-
+            row = conn.execute("""
+                SELECT
+                    COUNT(*) AS total_employees,
+                    COUNT(DISTINCT team) AS total_teams,
+                    (SELECT COUNT(*) FROM query_log) AS total_queries
+                FROM employees
+                WHERE is_active = 1
+            """).fetchone()
+            return dict(row)
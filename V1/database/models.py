@@ -6,7 +6,7 @@ from typing import Optional, List
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Employee:
     """Employee data model matching Excel structure"""
     formal_name: str
@@ -39,7 +39,7 @@ class Employee:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EmployeeSkill:
     """Derived skills for employees"""
     employee_id: int
@@ -51,7 +51,7 @@ class EmployeeSkill:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleOwnership:
     """Role ownership and accountability"""
     employee_id: int
@@ -44,6 +44,8 @@ CREATE TABLE IF NOT EXISTS employee_skills (
 
 CREATE INDEX IF NOT EXISTS idx_skill_name ON employee_skills(skill_name);
 CREATE INDEX IF NOT EXISTS idx_employee_skill ON employee_skills(employee_id);
+-- Covers the skill lookup: filter on name, confidence order, employee id for the join
+CREATE INDEX IF NOT EXISTS idx_skills_name_conf ON employee_skills(skill_name, confidence_score DESC, employee_id);
 
 -- ============================================
 -- 3. Role Ownership Table (Key for Survey Insight)
@@ -61,6 +63,9 @@ CREATE TABLE IF NOT EXISTS role_ownership (
 
 CREATE INDEX IF NOT EXISTS idx_responsibility ON role_ownership(responsibility_area);
 CREATE INDEX IF NOT EXISTS idx_ownership_type ON role_ownership(ownership_type);
+-- Covers the owner lookup over active rows: filter, CASE sort key and join column
+CREATE INDEX IF NOT EXISTS idx_ro_resp_type ON role_ownership(responsibility_area, ownership_type, employee_id)
+    WHERE is_active = 1;
 
 -- ============================================
 -- 4. Query Log (For Analytics & Improvement)
@@ -90,29 +95,30 @@ CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts USING fts5(
     team,
     location,
     content=employees,
-    content_rowid=id
+    content_rowid=id,
+    tokenize='unicode61 remove_diacritics 2',  -- "Jose" matches "José"
+    prefix='2 3 4 5 6 7 8 9 10'  -- Index prefixes so "Auck"* is a lookup, not a scan
 );
 
 -- Triggers to keep FTS in sync
+-- (external content table: removals must go through the 'delete' command with the old values)
 CREATE TRIGGER IF NOT EXISTS employees_ai AFTER INSERT ON employees BEGIN
     INSERT INTO employees_fts(rowid, formal_name, email_address, position_title, function, business_unit, team, location)
     VALUES (new.id, new.formal_name, new.email_address, new.position_title, new.function, new.business_unit, new.team, new.location);
 END;
 
 CREATE TRIGGER IF NOT EXISTS employees_ad AFTER DELETE ON employees BEGIN
-    DELETE FROM employees_fts WHERE rowid = old.id;
+    INSERT INTO employees_fts(employees_fts, rowid, formal_name, email_address, position_title, function, business_unit, team, location)
+    VALUES ('delete', old.id, old.formal_name, old.email_address, old.position_title, old.function, old.business_unit, old.team, old.location);
 END;
 
-CREATE TRIGGER IF NOT EXISTS employees_au AFTER UPDATE ON employees BEGIN
-    UPDATE employees_fts SET 
-        formal_name = new.formal_name,
-        email_address = new.email_address,
-        position_title = new.position_title,
-        function = new.function,
-        business_unit = new.business_unit,
-        team = new.team,
-        location = new.location
-    WHERE rowid = new.id;
+-- Only indexed columns re-index the row (people_leader_id updates skip FTS)
+CREATE TRIGGER IF NOT EXISTS employees_au
+AFTER UPDATE OF formal_name, email_address, position_title, function, business_unit, team, location ON employees BEGIN
+    INSERT INTO employees_fts(employees_fts, rowid, formal_name, email_address, position_title, function, business_unit, team, location)
+    VALUES ('delete', old.id, old.formal_name, old.email_address, old.position_title, old.function, old.business_unit, old.team, old.location);
+    INSERT INTO employees_fts(rowid, formal_name, email_address, position_title, function, business_unit, team, location)
+    VALUES (new.id, new.formal_name, new.email_address, new.position_title, new.function, new.business_unit, new.team, new.location);
 END;
 
 -- ============================================
@@ -3,11 +3,17 @@ OpenWebUI Function for Employee Finder Agent
 This can be imported as a custom function in OpenWebUI
 """
 
-import requests
+import asyncio
+import httpx
 from typing import Optional
 from pydantic import BaseModel, Field
 
 
+# Static section headers of the formatted response
+RECOMMENDED_HEADER = "👥 **Recommended Contacts:**\n\n"
+NEXT_STEPS_HEADER = "🚀 **Next Steps:**\n"
+
+
 class Tools:
     """Employee Finder Tools"""
     
@@ -20,8 +26,38 @@ class Tools:
     
     def __init__(self):
         self.valves = self.Valves()
+        # Created lazily by _get_client: an AsyncClient is bound to the event loop it first runs on
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the keep-alive client for the running event loop, creating it on first use
+        Concurrent tool calls share pooled connections and don't hold a worker thread
+        while waiting on the agent API
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            # A client left over from another (finished) loop can't be reused or awaited here
+            # Pool limits belong on the transport: a client given transport= ignores its own limits
+            self._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                ),
+                timeout=10
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled HTTP client (call on shutdown, from the loop that used it)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
     
-    def find_employee(
+    async def find_employee(
         self,
         query: str,
         __user__: Optional[dict] = None
@@ -37,10 +73,9 @@ class Tools:
         """
         try:
             # Call the agent API
-            response = requests.post(
+            response = await self._get_client().post(
                 f"{self.valves.AGENT_API_URL}/query",
-                json={"query": query},
-                timeout=10
+                json={"query": query}
             )
             response.raise_for_status()
             
@@ -48,33 +83,33 @@ class Tools:
             
             # Format the response
             if data.get('recommendations'):
-                result = f"✅ {data['understanding']}\n\n"
-                result += "👥 **Recommended Contacts:**\n\n"
+                parts = [f"✅ {data['understanding']}\n\n", RECOMMENDED_HEADER]
                 
                 for i, rec in enumerate(data['recommendations'][:5], 1):
                     emp = rec['employee']
-                    result += f"**{i}. {emp['formal_name']}**"
+                    parts.append(f"**{i}. {emp['formal_name']}**")
                     if rec.get('ownership_type'):
-                        result += f" ({rec['ownership_type']})"
-                    result += f"\n"
-                    result += f"   📧 {emp['email_address']}\n"
-                    result += f"   💼 {emp['position_title']}\n"
-                    result += f"   👥 Team: {emp['team']}\n"
-                    result += f"   🎯 Match: {int(rec['match_score']*100)}%"
+                        parts.append(f" ({rec['ownership_type']})")
+                    parts.append(
+                        "\n"
+                        f"   📧 {emp['email_address']}\n"
+                        f"   💼 {emp['position_title']}\n"
+                        f"   👥 Team: {emp['team']}\n"
+                        f"   🎯 Match: {int(rec['match_score']*100)}%"
+                    )
                     if rec.get('match_reasons'):
-                        result += f" - {', '.join(rec['match_reasons'])}"
-                    result += "\n\n"
+                        parts.append(f" - {', '.join(rec['match_reasons'])}")
+                    parts.append("\n\n")
                 
                 if data.get('next_steps'):
-                    result += "🚀 **Next Steps:**\n"
-                    for step in data['next_steps']:
-                        result += f"  • {step}\n"
+                    parts.append(NEXT_STEPS_HEADER)
+                    parts.extend(f"  • {step}\n" for step in data['next_steps'])
                 
-                return result
+                return "".join(parts)
             else:
                 return f"❌ {data.get('disclaimer', 'No results found')}\n\nTry:\n" + "\n".join(f"  • {step}" for step in data.get('next_steps', []))
         
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return f"❌ Error connecting to Employee Finder Agent: {str(e)}\n\nMake sure the agent is running at {self.valves.AGENT_API_URL}"
         except Exception as e:
             return f"❌ Error: {str(e)}"
@@ -19,16 +19,6 @@ def create_mock_data():
 
     db = DatabaseManager()
 
-    # Clear existing data
-    print("🗑️  Clearing existing data...")
-    with db.get_connection() as conn:
-        conn.execute("DELETE FROM query_log")
-        conn.execute("DELETE FROM role_ownership")
-        conn.execute("DELETE FROM employee_skills")
-        conn.execute("DELETE FROM employees")
-        conn.commit()
-    print("  ✅ Database cleared")
-    
     # Mock data
     teams = [
         "Network Infrastructure",
@@ -60,296 +50,200 @@ def create_mock_data():
         "Remote"
     ]
     
-    # Create employees
+    # Create employees: one row per person as
+    # (name, email, position, team, function, business_unit, location)
     employees_data = [
         # Network Team
-        {
-            "name": "John Smith",
-            "email": "john.smith@sample.com",
-            "position": "Senior Network Engineer",
-            "team": "Network Infrastructure",
-            "function": "Technology",
-            "business_unit": "Technology Services",
-            "location": "Auckland",
-            "is_leader": True
-        },
-        {
-            "name": "Sarah Johnson",
-            "email": "sarah.johnson@sample.com",
-            "position": "Network Security Specialist",
-            "team": "Network Infrastructure",
-            "function": "Technology",
-            "business_unit": "Technology Services",
-            "location": "Auckland",
-            "leader_email": "john.smith@sample.com"
-        },
-        {
-            "name": "Mike Chen",
-            "email": "mike.chen@sample.com",
-            "position": "Network Engineer",
-            "team": "Network Infrastructure",
-            "function": "Technology",
-            "business_unit": "Technology Services",
-            "location": "Wellington",
-            "leader_email": "john.smith@sample.com"
-        },
-        
+        ("John Smith", "john.smith@sample.com", "Senior Network Engineer", "Network Infrastructure", "Technology", "Technology Services", "Auckland"),
+        ("Sarah Johnson", "sarah.johnson@sample.com", "Network Security Specialist", "Network Infrastructure", "Technology", "Technology Services", "Auckland"),
+        ("Mike Chen", "mike.chen@sample.com", "Network Engineer", "Network Infrastructure", "Technology", "Technology Services", "Wellington"),
+
         # Provisioning Team
-        {
-            "name": "Emma Wilson",
-            "email": "emma.wilson@sample.com",
-            "position": "BIA Provisioning Lead",
-            "team": "Provisioning Services",
-            "function": "Operations",
-            "business_unit": "Service Delivery",
-            "location": "Auckland",
-            "is_leader": True
-        },
-        {
-            "name": "David Brown",
-            "email": "david.brown@sample.com",
-            "position": "Provisioning Specialist",
-            "team": "Provisioning Services",
-            "function": "Operations",
-            "business_unit": "Service Delivery",
-            "location": "Auckland",
-            "leader_email": "emma.wilson@sample.com"
-        },
-        {
-            "name": "Lisa Taylor",
-            "email": "lisa.taylor@sample.com",
-            "position": "Enterprise Provisioning Engineer",
-            "team": "Provisioning Services",
-            "function": "Operations",
-            "business_unit": "Service Delivery",
-            "location": "Wellington",
-            "leader_email": "emma.wilson@sample.com"
-        },
-        
+        ("Emma Wilson", "emma.wilson@sample.com", "BIA Provisioning Lead", "Provisioning Services", "Operations", "Service Delivery", "Auckland"),
+        ("David Brown", "david.brown@sample.com", "Provisioning Specialist", "Provisioning Services", "Operations", "Service Delivery", "Auckland"),
+        ("Lisa Taylor", "lisa.taylor@sample.com", "Enterprise Provisioning Engineer", "Provisioning Services", "Operations", "Service Delivery", "Wellington"),
+
         # Billing Team
-        {
-            "name": "Robert Davis",
-            "email": "robert.davis@sample.com",
-            "position": "Billing Manager",
-            "team": "Billing Operations",
-            "function": "Finance",
-            "business_unit": "Finance & Billing",
-            "location": "Auckland",
-            "is_leader": True
-        },
-        {
-            "name": "Jennifer Lee",
-            "email": "jennifer.lee@sample.com",
-            "position": "Billing Specialist",
-            "team": "Billing Operations",
-            "function": "Finance",
-            "business_unit": "Finance & Billing",
-            "location": "Auckland",
-            "leader_email": "robert.davis@sample.com"
-        },
-        {
-            "name": "Tom Anderson",
-            "email": "tom.anderson@sample.com",
-            "position": "Revenue Analyst",
-            "team": "Billing Operations",
-            "function": "Finance",
-            "business_unit": "Finance & Billing",
-            "location": "Christchurch",
-            "leader_email": "robert.davis@sample.com"
-        },
-        
+        ("Robert Davis", "robert.davis@sample.com", "Billing Manager", "Billing Operations", "Finance", "Finance & Billing", "Auckland"),
+        ("Jennifer Lee", "jennifer.lee@sample.com", "Billing Specialist", "Billing Operations", "Finance", "Finance & Billing", "Auckland"),
+        ("Tom Anderson", "tom.anderson@sample.com", "Revenue Analyst", "Billing Operations", "Finance", "Finance & Billing", "Christchurch"),
+
         # Security Team
-        {
-            "name": "Alice Martinez",
-            "email": "alice.martinez@sample.com",
-            "position": "Security Compliance Manager",
-            "team": "Security & Compliance",
-            "function": "Technology",
-            "business_unit": "Risk & Compliance",
-            "location": "Auckland",
-            "is_leader": True
-        },
-        {
-            "name": "Chris Wong",
-            "email": "chris.wong@sample.com",
-            "position": "Security Analyst",
-            "team": "Security & Compliance",
-            "function": "Technology",
-            "business_unit": "Risk & Compliance",
-            "location": "Wellington",
-            "leader_email": "alice.martinez@sample.com"
-        },
-        
+        ("Alice Martinez", "alice.martinez@sample.com", "Security Compliance Manager", "Security & Compliance", "Technology", "Risk & Compliance", "Auckland"),
+        ("Chris Wong", "chris.wong@sample.com", "Security Analyst", "Security & Compliance", "Technology", "Risk & Compliance", "Wellington"),
+
         # Customer Support
-        {
-            "name": "Maria Garcia",
-            "email": "maria.garcia@sample.com",
-            "position": "Customer Support Lead",
-            "team": "Customer Support",
-            "function": "Customer Service",
-            "business_unit": "Customer Experience",
-            "location": "Auckland",
-            "is_leader": True
-        },
-        {
-            "name": "James Wilson",
-            "email": "james.wilson@sample.com",
-            "position": "Support Specialist",
-            "team": "Customer Support",
-            "function": "Customer Service",
-            "business_unit": "Customer Experience",
-            "location": "Hamilton",
-            "leader_email": "maria.garcia@sample.com"
-        },
+        ("Maria Garcia", "maria.garcia@sample.com", "Customer Support Lead", "Customer Support", "Customer Service", "Customer Experience", "Auckland"),
+        ("James Wilson", "james.wilson@sample.com", "Support Specialist", "Customer Support", "Customer Service", "Customer Experience", "Hamilton"),
 
         # IT Support / IT Operations
-        {
-            "name": "Kevin Brown",
-            "email": "kevin.brown@sample.com",
-            "position": "IT Support Manager",
-            "team": "IT Operations",
-            "function": "Technology",
-            "business_unit": "Technology Services",
-            "location": "Auckland",
-            "is_leader": True
-        },
-        {
-            "name": "Rachel Green",
-            "email": "rachel.green@sample.com",
-            "position": "IT Support Specialist",
-            "team": "IT Operations",
-            "function": "Technology",
-            "business_unit": "Technology Services",
-            "location": "Wellington",
-            "leader_email": "kevin.brown@sample.com"
-        },
-        {
-            "name": "Daniel Kim",
-            "email": "daniel.kim@sample.com",
-            "position": "Help Desk Technician",
-            "team": "IT Operations",
-            "function": "Technology",
-            "business_unit": "Technology Services",
-            "location": "Auckland",
-            "leader_email": "kevin.brown@sample.com"
-        },
+        ("Kevin Brown", "kevin.brown@sample.com", "IT Support Manager", "IT Operations", "Technology", "Technology Services", "Auckland"),
+        ("Rachel Green", "rachel.green@sample.com", "IT Support Specialist", "IT Operations", "Technology", "Technology Services", "Wellington"),
+        ("Daniel Kim", "daniel.kim@sample.com", "Help Desk Technician", "IT Operations", "Technology", "Technology Services", "Auckland"),
     ]
+
+    # People leader of each employee who reports to someone (by email)
+    leaders = {
+        "sarah.johnson@sample.com": "john.smith@sample.com",
+        "mike.chen@sample.com": "john.smith@sample.com",
+        "david.brown@sample.com": "emma.wilson@sample.com",
+        "lisa.taylor@sample.com": "emma.wilson@sample.com",
+        "jennifer.lee@sample.com": "robert.davis@sample.com",
+        "tom.anderson@sample.com": "robert.davis@sample.com",
+        "chris.wong@sample.com": "alice.martinez@sample.com",
+        "james.wilson@sample.com": "maria.garcia@sample.com",
+        "rachel.green@sample.com": "kevin.brown@sample.com",
+        "daniel.kim@sample.com": "kevin.brown@sample.com",
+    }
     
-    print(f"\n📝 Creating {len(employees_data)} employees...")
-    
+    # Clear and reload in one transaction. Mock data is disposable, so the load
+    # also skips fsyncs (synchronous=OFF) and restores the normal level after
+    with db.get_connection() as conn:
+        conn.execute("PRAGMA synchronous=OFF")
+        try:
+            # Clear existing data
+            print("🗑️  Clearing existing data...")
+            conn.execute("DELETE FROM query_log")
+            conn.execute("DELETE FROM role_ownership")
+            conn.execute("DELETE FROM employee_skills")
+            conn.execute("DELETE FROM employees")
+            print("  ✅ Database cleared")
+
+            print(f"\n📝 Creating {len(employees_data)} employees...")
+            _load_mock_rows(db, employees_data, leaders)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+    # Print summary
+    print("\n" + "="*60)
+    print("📊 Mock Data Summary")
+    print("="*60)
+
+    with db.get_connection() as conn:
+        # All three counts in one round-trip, read by position
+        emp_count, skill_count, ownership_count = conn.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM employees),
+                (SELECT COUNT(*) FROM employee_skills),
+                (SELECT COUNT(*) FROM role_ownership)
+        """).fetchone()
+
+    print(f"Total Employees: {emp_count}")
+    print(f"Total Skills: {skill_count}")
+    print(f"Total Ownerships: {ownership_count}")
+
+    print("\n✅ Mock data created successfully!")
+    print("\n💡 You can now:")
+    print("   1. Start the server: python scripts/start_server.py")
+    print("   2. Test queries: curl -X POST http://localhost:8000/query \\")
+    print("      -H 'Content-Type: application/json' \\")
+    print("      -d '{\"query\": \"I need help with BIA provisioning\"}'")
+    print("   3. Check health: curl http://localhost:8000/health")
+
+    return True
+
+
+def _load_mock_rows(db: DatabaseManager, employees_data, leaders):
+    """Insert the mock employees, leaders, skills and ownerships with batched statements"""
     # First pass: Create all employees
-    employee_map = {}
-    for emp_data in employees_data:
-        employee = Employee(
-            formal_name=emp_data["name"],
-            email_address=emp_data["email"],
-            position_title=emp_data["position"],
-            team=emp_data["team"],
-            function=emp_data["function"],
-            business_unit=emp_data["business_unit"],
-            location=emp_data["location"]
+    employees = [
+        Employee(
+            formal_name=name,
+            email_address=email,
+            position_title=position,
+            team=team,
+            function=function,
+            business_unit=business_unit,
+            location=location
         )
-        emp_id = db.insert_employee(employee)
-        employee_map[emp_data["email"]] = emp_id
-        print(f"  ✅ Created: {emp_data['name']} ({emp_data['position']})")
+        for name, email, position, team, function, business_unit, location in employees_data
+    ]
+    # Ids come back from the insert itself (RETURNING), in employees_data order
+    emp_ids = db.insert_employees_bulk(employees)
+    employee_map = dict(zip((employee.email_address for employee in employees), emp_ids))
+    print(f"  ✅ Created {len(emp_ids)} employees")
     
     # Second pass: Update people leaders
     print(f"\n👥 Setting up people leader relationships...")
-    for emp_data in employees_data:
-        if "leader_email" in emp_data:
-            emp_id = employee_map[emp_data["email"]]
-            leader_id = employee_map[emp_data["leader_email"]]
-            db.update_employee_leader(emp_id, leader_id)
-            print(f"  ✅ {emp_data['name']} → reports to → {emp_data['leader_email']}")
+    leader_links = []
+    for employee in employees:
+        leader_email = leaders.get(employee.email_address)
+        if leader_email:
+            leader_links.append((employee_map[employee.email_address], employee_map[leader_email]))
+    db.update_employee_leaders(leader_links)
+    print(f"  ✅ Linked {len(leader_links)} employees to their people leader")
     
     print(f"\n🎯 Deriving skills from positions and teams...")
     # The database manager should auto-derive skills, but let's add some manually too
+    # Rows reference employees by their index in employees_data (resolved through emp_ids)
     skills_data = [
-        (employee_map["john.smith@sample.com"], "network", "technical", 0.9, "position_title"),
-        (employee_map["john.smith@sample.com"], "infrastructure", "technical", 0.8, "team"),
-        (employee_map["sarah.johnson@sample.com"], "security", "technical", 0.9, "position_title"),
-        (employee_map["sarah.johnson@sample.com"], "network", "technical", 0.8, "team"),
-        (employee_map["emma.wilson@sample.com"], "provisioning", "technical", 0.9, "position_title"),
-        (employee_map["emma.wilson@sample.com"], "BIA", "technical", 0.9, "position_title"),
-        (employee_map["david.brown@sample.com"], "provisioning", "technical", 0.8, "position_title"),
-        (employee_map["lisa.taylor@sample.com"], "provisioning", "technical", 0.8, "position_title"),
-        (employee_map["lisa.taylor@sample.com"], "enterprise", "business", 0.7, "position_title"),
-        (employee_map["robert.davis@sample.com"], "billing", "business", 0.9, "position_title"),
-        (employee_map["jennifer.lee@sample.com"], "billing", "business", 0.8, "position_title"),
-        (employee_map["alice.martinez@sample.com"], "security", "technical", 0.9, "position_title"),
-        (employee_map["alice.martinez@sample.com"], "compliance", "business", 0.9, "position_title"),
-        (employee_map["kevin.brown@sample.com"], "IT support", "technical", 0.9, "position_title"),
-        (employee_map["kevin.brown@sample.com"], "help desk", "technical", 0.8, "team"),
-        (employee_map["rachel.green@sample.com"], "IT support", "technical", 0.8, "position_title"),
-        (employee_map["daniel.kim@sample.com"], "help desk", "technical", 0.9, "position_title"),
-        (employee_map["daniel.kim@sample.com"], "IT support", "technical", 0.7, "team"),
+        (0, "network", "technical", 0.9, "position_title"),  # John Smith
+        (0, "infrastructure", "technical", 0.8, "team"),  # John Smith
+        (1, "security", "technical", 0.9, "position_title"),  # Sarah Johnson
+        (1, "network", "technical", 0.8, "team"),  # Sarah Johnson
+        (3, "provisioning", "technical", 0.9, "position_title"),  # Emma Wilson
+        (3, "BIA", "technical", 0.9, "position_title"),  # Emma Wilson
+        (4, "provisioning", "technical", 0.8, "position_title"),  # David Brown
+        (5, "provisioning", "technical", 0.8, "position_title"),  # Lisa Taylor
+        (5, "enterprise", "business", 0.7, "position_title"),  # Lisa Taylor
+        (6, "billing", "business", 0.9, "position_title"),  # Robert Davis
+        (7, "billing", "business", 0.8, "position_title"),  # Jennifer Lee
+        (9, "security", "technical", 0.9, "position_title"),  # Alice Martinez
+        (9, "compliance", "business", 0.9, "position_title"),  # Alice Martinez
+        (13, "IT support", "technical", 0.9, "position_title"),  # Kevin Brown
+        (13, "help desk", "technical", 0.8, "team"),  # Kevin Brown
+        (14, "IT support", "technical", 0.8, "position_title"),  # Rachel Green
+        (15, "help desk", "technical", 0.9, "position_title"),  # Daniel Kim
+        (15, "IT support", "technical", 0.7, "team"),  # Daniel Kim
     ]
 
-    for emp_id, skill_name, skill_category, confidence, source in skills_data:
-        skill = EmployeeSkill(
-            employee_id=emp_id,
+    n_skills = db.insert_skills_bulk([
+        EmployeeSkill(
+            employee_id=emp_ids[index],
             skill_name=skill_name,
             skill_category=skill_category,
             confidence_score=confidence,
             source=source
         )
-        db.insert_skill(skill)
+        for index, skill_name, skill_category, confidence, source in skills_data
+    ])
 
-    print(f"  ✅ Added {len(skills_data)} skills")
+    print(f"  ✅ Added {n_skills} skills")
 
     print(f"\n🎯 Creating role ownership assignments...")
-    # Add ownership data
+    # Add ownership data (employees by index, as for skills)
     ownership_data = [
-        (employee_map["emma.wilson@sample.com"], "BIA provisioning", "primary", "Provisioning Services"),
-        (employee_map["david.brown@sample.com"], "BIA provisioning", "backup", "Provisioning Services"),
-        (employee_map["lisa.taylor@sample.com"], "enterprise provisioning", "primary", "Provisioning Services"),
-        (employee_map["john.smith@sample.com"], "network infrastructure", "primary", "Network Infrastructure"),
-        (employee_map["sarah.johnson@sample.com"], "network security", "primary", "Network Infrastructure"),
-        (employee_map["mike.chen@sample.com"], "network infrastructure", "backup", "Network Infrastructure"),
-        (employee_map["robert.davis@sample.com"], "billing operations", "primary", "Billing Operations"),
-        (employee_map["jennifer.lee@sample.com"], "billing operations", "backup", "Billing Operations"),
-        (employee_map["alice.martinez@sample.com"], "security compliance", "primary", "Security & Compliance"),
-        (employee_map["chris.wong@sample.com"], "security compliance", "backup", "Security & Compliance"),
-        (employee_map["maria.garcia@sample.com"], "customer support", "primary", "Customer Support"),
-        (employee_map["kevin.brown@sample.com"], "IT support", "primary", "IT Operations"),
-        (employee_map["rachel.green@sample.com"], "IT support", "backup", "IT Operations"),
-        (employee_map["daniel.kim@sample.com"], "help desk", "primary", "IT Operations"),
+        (3, "BIA provisioning", "primary", "Provisioning Services"),  # Emma Wilson
+        (4, "BIA provisioning", "backup", "Provisioning Services"),  # David Brown
+        (5, "enterprise provisioning", "primary", "Provisioning Services"),  # Lisa Taylor
+        (0, "network infrastructure", "primary", "Network Infrastructure"),  # John Smith
+        (1, "network security", "primary", "Network Infrastructure"),  # Sarah Johnson
+        (2, "network infrastructure", "backup", "Network Infrastructure"),  # Mike Chen
+        (6, "billing operations", "primary", "Billing Operations"),  # Robert Davis
+        (7, "billing operations", "backup", "Billing Operations"),  # Jennifer Lee
+        (9, "security compliance", "primary", "Security & Compliance"),  # Alice Martinez
+        (10, "security compliance", "backup", "Security & Compliance"),  # Chris Wong
+        (11, "customer support", "primary", "Customer Support"),  # Maria Garcia
+        (13, "IT support", "primary", "IT Operations"),  # Kevin Brown
+        (14, "IT support", "backup", "IT Operations"),  # Rachel Green
+        (15, "help desk", "primary", "IT Operations"),  # Daniel Kim
     ]
 
-    for emp_id, responsibility, ownership_type, team in ownership_data:
-        ownership = RoleOwnership(
-            employee_id=emp_id,
+    n_ownerships = db.insert_role_ownerships_bulk([
+        RoleOwnership(
+            employee_id=emp_ids[index],
             responsibility_area=responsibility,
             ownership_type=ownership_type,
             team=team
         )
-        db.insert_role_ownership(ownership)
-
-    print(f"  ✅ Added {len(ownership_data)} ownership assignments")
-
-    # Print summary
-    print("\n" + "="*60)
-    print("📊 Mock Data Summary")
-    print("="*60)
-
-    with db.get_connection() as conn:
-        emp_count = conn.execute("SELECT COUNT(*) as c FROM employees").fetchone()['c']
-        skill_count = conn.execute("SELECT COUNT(*) as c FROM employee_skills").fetchone()['c']
-        ownership_count = conn.execute("SELECT COUNT(*) as c FROM role_ownership").fetchone()['c']
+        for index, responsibility, ownership_type, team in ownership_data
+    ])
 
-    print(f"Total Employees: {emp_count}")
-    print(f"Total Skills: {skill_count}")
-    print(f"Total Ownerships: {ownership_count}")
-
-    print("\n✅ Mock data created successfully!")
-    print("\n💡 You can now:")
-    print("   1. Start the server: python scripts/start_server.py")
-    print("   2. Test queries: curl -X POST http://localhost:8000/query \\")
-    print("      -H 'Content-Type: application/json' \\")
-    print("      -d '{\"query\": \"I need help with BIA provisioning\"}'")
-    print("   3. Check health: curl http://localhost:8000/health")
-
-    return True
+    print(f"  ✅ Added {n_ownerships} ownership assignments")
 
 
 if __name__ == "__main__":
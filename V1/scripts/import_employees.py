@@ -52,15 +52,10 @@ def main():
     logger.info("Creating importer...")
     importer = ExcelImporter(db_manager)
     
-    # Import data
+    # Import data (role ownerships are derived as employees are written)
     logger.info(f"Importing from: {excel_path}")
     stats = importer.import_from_excel(excel_path)
     
-    # Derive role ownerships
-    logger.info("Deriving role ownerships...")
-    ownership_count = importer.derive_role_ownerships()
-    stats['imported_ownerships'] = ownership_count
-    
     # Print summary
     logger.info("=" * 60)
     logger.info("Import Summary:")
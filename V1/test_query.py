@@ -10,9 +10,13 @@ from agent.ai_agent import EnhancedEmployeeFinderAgent
 # Check database
 db = DatabaseManager()
 with db.get_connection() as conn:
-    emp_count = conn.execute("SELECT COUNT(*) as c FROM employees").fetchone()['c']
-    skill_count = conn.execute("SELECT COUNT(*) as c FROM employee_skills").fetchone()['c']
-    ownership_count = conn.execute("SELECT COUNT(*) as c FROM role_ownership").fetchone()['c']
+    # All three counts in one round-trip
+    emp_count, skill_count, ownership_count = conn.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM employees),
+            (SELECT COUNT(*) FROM employee_skills),
+            (SELECT COUNT(*) FROM role_ownership)
+    """).fetchone()
     
     print(f"📊 Database Stats:")
     print(f"  Employees: {emp_count}")
@@ -20,9 +24,11 @@ with db.get_connection() as conn:
     print(f"  Ownerships: {ownership_count}")
     
     print(f"\n🎯 Sample Ownerships:")
-    rows = conn.execute("SELECT * FROM role_ownership LIMIT 5").fetchall()
-    for row in rows:
-        print(f"  - {row['responsibility_area']} ({row['ownership_type']})")
+    rows = conn.execute(
+        "SELECT responsibility_area, ownership_type FROM role_ownership LIMIT 5"
+    ).fetchall()
+    for area, ownership_type in rows:
+        print(f"  - {area} ({ownership_type})")
 
 # Test agent
 print(f"\n🤖 Testing Agent...")
@@ -126,7 +126,10 @@ def test_role_ownership():
     # Search by responsibility
     owners = db.get_owners_by_responsibility("bia provisioning")
     assert len(owners) > 0
-    assert owners[0]['ownership_type'] == 'primary'
+    employee, ownership_type, area = owners[0]
+    assert employee.id == emp_id
+    assert ownership_type == 'primary'
+    assert area == 'bia provisioning'
     
     print("✅ Role ownership test passed")
 
@@ -0,0 +1,212 @@
+"""
+Tests for the DatabaseManager connection pool, caches and schema migration
+Run with: pytest tests/test_db_manager.py
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.db_manager import DatabaseManager, _SCHEMA_VERSION
+from database.models import Employee, EmployeeSkill
+
+
+def _employee(name: str) -> Employee:
+    """Minimal test employee"""
+    return Employee(
+        formal_name=name,
+        email_address=f"{name.lower().replace(' ', '.')}@sample.com",
+        position_title="Network Engineer",
+        team="Network Infrastructure"
+    )
+
+
+def _employee_count(db: DatabaseManager) -> int:
+    with db.get_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+
+def test_exception_rolls_back(tmp_path):
+    """Test that an exception inside get_connection() leaves no rows written"""
+    db = DatabaseManager(db_path=str(tmp_path / "pool.db"), pool_size=2)
+
+    with pytest.raises(RuntimeError):
+        with db.get_connection() as conn:
+            db.insert_employee(_employee("John Doe"))
+            assert conn.in_transaction
+            raise RuntimeError("boom")
+
+    assert _employee_count(db) == 0
+    assert db.get_employee_by_email("john.doe@sample.com") is None
+
+    print("✅ Rollback on exception test passed")
+
+
+def test_connection_returned_on_error(tmp_path):
+    """Test that a failed block hands its connection back to the pool, outside a transaction"""
+    db = DatabaseManager(db_path=str(tmp_path / "pool.db"), pool_size=2)
+    opened, idle = db._opened, len(db._idle)
+
+    for _ in range(3):  # More failures than pool slots
+        with pytest.raises(RuntimeError):
+            with db.get_connection(immediate=True):
+                raise RuntimeError("boom")
+
+    assert (db._opened, len(db._idle)) == (opened, idle)
+    assert not any(conn.in_transaction for conn in db._idle)
+    assert _employee_count(db) == 0  # Still usable
+
+    print("✅ Connection return on error test passed")
+
+
+def test_nested_call_joins_transaction(tmp_path):
+    """Test that a nested get_connection() shares the outer transaction and doesn't commit it"""
+    db = DatabaseManager(db_path=str(tmp_path / "pool.db"), pool_size=2)
+
+    with pytest.raises(RuntimeError):
+        with db.get_connection() as outer:
+            with db.get_connection() as inner:
+                assert inner is outer
+                db.insert_employee(_employee("John Doe"))
+            # The inner block exited without committing
+            assert outer.in_transaction
+            raise RuntimeError("boom")
+
+    assert _employee_count(db) == 0
+
+    with db.get_connection():
+        db.insert_employee(_employee("Jane Smith"))
+        db.insert_employee(_employee("Bob Wilson"))
+    assert _employee_count(db) == 2
+
+    print("✅ Nested transaction test passed")
+
+
+def test_write_invalidates_cached_reads(tmp_path):
+    """Test that inserts and updates through the manager are visible to the cached reads"""
+    db = DatabaseManager(db_path=str(tmp_path / "cache.db"))
+    john_id = db.insert_employee(_employee("John Doe"))
+
+    # Warm every read cache
+    assert [e.id for e in db.search_employees_fulltext("network")] == [john_id]
+    assert [e.id for e in db.search_employees_by_criteria(team="Network")] == [john_id]
+    assert db.get_employees_by_skill("routing") == []
+    assert db.get_employee_by_email("jane.smith@sample.com") is None
+    assert db.get_employee_by_id(john_id).people_leader_id is None
+
+    # Insert
+    jane_id = db.insert_employee(_employee("Jane Smith"))
+    db.insert_skill(EmployeeSkill(employee_id=jane_id, skill_name="routing", confidence_score=0.8))
+
+    assert {e.id for e in db.search_employees_fulltext("network")} == {john_id, jane_id}
+    assert {e.id for e in db.search_employees_by_criteria(team="Network")} == {john_id, jane_id}
+    assert [e.id for e in db.get_employees_by_skill("routing")] == [jane_id]
+    assert db.get_employee_by_email("jane.smith@sample.com").id == jane_id
+
+    # Update
+    db.update_employee_leader(john_id, jane_id)
+    assert db.get_employee_by_id(john_id).people_leader_id == jane_id
+
+    print("✅ Cache invalidation test passed")
+
+
+# Employees table and FTS objects as created by the original schema: no diacritic
+# folding, and sync triggers that edit the external-content index directly
+OLD_SCHEMA_SQL = """
+CREATE TABLE employees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    formal_name TEXT NOT NULL,
+    email_address TEXT UNIQUE NOT NULL,
+    position_title TEXT NOT NULL,
+    function TEXT,
+    business_unit TEXT,
+    team TEXT,
+    location TEXT,
+    people_leader_id INTEGER,
+    is_active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (people_leader_id) REFERENCES employees(id)
+);
+
+CREATE VIRTUAL TABLE employees_fts USING fts5(
+    formal_name, email_address, position_title, function, business_unit, team, location,
+    content=employees,
+    content_rowid=id
+);
+
+CREATE TRIGGER employees_ai AFTER INSERT ON employees BEGIN
+    INSERT INTO employees_fts(rowid, formal_name, email_address, position_title, function, business_unit, team, location)
+    VALUES (new.id, new.formal_name, new.email_address, new.position_title, new.function, new.business_unit, new.team, new.location);
+END;
+
+CREATE TRIGGER employees_ad AFTER DELETE ON employees BEGIN
+    DELETE FROM employees_fts WHERE rowid = old.id;
+END;
+
+CREATE TRIGGER employees_au AFTER UPDATE ON employees BEGIN
+    UPDATE employees_fts SET
+        formal_name = new.formal_name,
+        email_address = new.email_address,
+        position_title = new.position_title,
+        function = new.function,
+        business_unit = new.business_unit,
+        team = new.team,
+        location = new.location
+    WHERE rowid = new.id;
+END;
+
+INSERT INTO employees (formal_name, email_address, position_title, team, location)
+VALUES ('José Ruiz', 'jose.ruiz@sample.com', 'Network Engineer', 'Network Infrastructure', 'Auckland'),
+       ('Jane Smith', 'jane.smith@sample.com', 'Billing Analyst', 'Billing Operations', 'Wellington');
+"""
+
+
+def test_fts_migration_from_old_schema(tmp_path):
+    """Test that opening an old-schema database rebuilds the FTS index and replaces its triggers"""
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(OLD_SCHEMA_SQL)
+    conn.close()
+
+    db = DatabaseManager(db_path=str(db_path))
+
+    def matches(query):
+        with db.get_connection() as conn:
+            return {row[0] for row in conn.execute(
+                "SELECT rowid FROM employees_fts WHERE employees_fts MATCH ?", (query,)
+            )}
+
+    with db.get_connection() as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+        triggers = {
+            row['name']: row['sql']
+            for row in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'")
+        }
+        fts_sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'employees_fts'").fetchone()[0]
+        jose_id, jane_id = [row[0] for row in conn.execute("SELECT id FROM employees ORDER BY id")]
+
+    assert set(triggers) == {'employees_ai', 'employees_ad', 'employees_au'}
+    assert "'delete'" in triggers['employees_ad'] and "'delete'" in triggers['employees_au']
+    assert 'remove_diacritics' in fts_sql
+
+    # Existing rows were re-indexed with the new tokenizer
+    assert matches('jose') == {jose_id}
+    assert matches('billing') == {jane_id}
+
+    # Updates replace the old terms, deletes remove the row
+    with db.get_connection() as conn:
+        conn.execute("UPDATE employees SET team = 'Provisioning Services' WHERE id = ?", (jane_id,))
+    assert matches('team:billing') == set()
+    assert matches('team:provisioning') == {jane_id}
+
+    with db.get_connection() as conn:
+        conn.execute("DELETE FROM employees WHERE id = ?", (jose_id,))
+    assert matches('network') == set()
+    assert matches('jose') == set()
+
+    print("✅ FTS migration test passed")
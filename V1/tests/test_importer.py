@@ -0,0 +1,133 @@
+"""
+Tests for the streaming Excel importer
+Run with: pytest tests/test_importer.py
+"""
+import sys
+from pathlib import Path
+
+from openpyxl import Workbook
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.db_manager import DatabaseManager
+from data_import.excel_importer import ExcelImporter
+
+
+HEADER = [
+    'Formal Name', 'Email Address', 'People Leader Formal Name', 'Position Title',
+    'Function (Label)', 'Business Unit (Label)', 'Team (Label)', 'Location (Name)',
+]
+
+ROWS = [
+    ['Alice Lead', 'Alice@Sample.com', None, 'Network Infrastructure Lead',
+     'Technology', 'Technology Services', 'Network Infrastructure', 'Auckland'],
+    ['Bob Jones', 'bob@sample.com', 'Alice Lead', 'Junior Support Analyst',
+     'Operations', 'Service Delivery', 'Customer Support', 'Wellington'],
+    [None] * 8,  # Blank line, skipped without counting as a row
+    ['Carol Smith', 'carol@sample.com', 'alice lead', 'Billing Manager',
+     'Finance', 'Finance', 'Billing Operations', 'Auckland'],
+    ['Dan Brown', 'dan@sample.com', 'Nobody Known', 'Provisioning Specialist',
+     'Operations', 'Service Delivery', 'Provisioning Services', 'Auckland'],
+    ['Eve Adams', 'eve@sample.com', 'Carol Smith', 'Data Analyst',
+     None, None, None, None],
+    ['Bob Again', 'bob@sample.com', None, 'Engineer', None, None, None, None],  # Duplicate email
+]
+
+
+def _write_workbook(path: Path) -> Path:
+    """Write HEADER and ROWS as the first sheet of an .xlsx file"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(HEADER)
+    for row in ROWS:
+        sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+def _import(tmp_path: Path, chunk_rows: int = ExcelImporter.IMPORT_CHUNK_ROWS):
+    """Import the test workbook into a fresh database, returns (db, importer, stats)"""
+    db = DatabaseManager(db_path=str(tmp_path / "employees.db"))
+    importer = ExcelImporter(db)
+    importer.IMPORT_CHUNK_ROWS = chunk_rows
+    stats = importer.import_from_excel(str(_write_workbook(tmp_path / "employees.xlsx")))
+    return db, importer, stats
+
+
+def _table_dump(db: DatabaseManager):
+    """All imported rows, for comparing two imports"""
+    with db.get_connection() as conn:
+        return [
+            [tuple(row) for row in conn.execute(sql)]
+            for sql in (
+                "SELECT id, formal_name, email_address, people_leader_id FROM employees ORDER BY id",
+                "SELECT employee_id, skill_name, confidence_score, source FROM employee_skills"
+                " ORDER BY employee_id, skill_name",
+                "SELECT employee_id, responsibility_area, ownership_type FROM role_ownership"
+                " ORDER BY employee_id, responsibility_area",
+            )
+        ]
+
+
+def test_import_counts(tmp_path):
+    """Test employee, skill, ownership and leader counts of an import"""
+    db, _, stats = _import(tmp_path)
+
+    assert stats == {
+        'total_rows': 6,
+        'imported_employees': 5,
+        'imported_skills': 5,
+        'imported_ownerships': 4,
+        'errors': 1,
+    }
+
+    alice = db.get_employee_by_email("alice@sample.com")
+    bob = db.get_employee_by_email("bob@sample.com")
+    carol = db.get_employee_by_email("carol@sample.com")
+    dan = db.get_employee_by_email("dan@sample.com")
+    eve = db.get_employee_by_email("eve@sample.com")
+
+    # Leaders resolve by name case-insensitively; an unknown leader stays unset
+    assert alice.people_leader_id is None
+    assert bob.people_leader_id == alice.id
+    assert carol.people_leader_id == alice.id
+    assert dan.people_leader_id is None
+    assert eve.people_leader_id == carol.id
+    assert bob.formal_name == "Bob Jones"  # The duplicate row was rejected
+
+    owners = db.get_owners_by_responsibility("customer support")
+    assert [(employee.id, ownership_type) for employee, ownership_type, _ in owners] == [(bob.id, 'backup')]
+
+    print("✅ Import counts test passed")
+
+
+def test_import_chunk_boundaries(tmp_path):
+    """Test that writing the sheet in small chunks gives the same data as one chunk"""
+    db, _, stats = _import(tmp_path / "one")
+    chunked_db, _, chunked_stats = _import(tmp_path / "chunked", chunk_rows=2)
+
+    assert chunked_stats == stats
+    assert _table_dump(chunked_db) == _table_dump(db)
+
+    print("✅ Import chunk boundary test passed")
+
+
+def test_skill_matchers_agree(tmp_path, monkeypatch):
+    """Test that the regex skill matcher finds the same skills as the Aho-Corasick one
+    (without pyahocorasick installed both runs take the regex path)"""
+    _, importer, _ = _import(tmp_path)
+    employees = importer._imported_employees
+
+    def skills():
+        return [
+            (skill.employee_id, skill.skill_name, skill.confidence_score, skill.source)
+            for skill in importer._derive_skills_batch(employees)
+        ]
+
+    default_skills = skills()
+    monkeypatch.setattr(ExcelImporter, '_SKILL_AUTOMATON', None)
+    assert skills() == default_skills
+    assert len(default_skills) == 5
+
+    print("✅ Skill matcher test passed")
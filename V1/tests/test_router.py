@@ -2,6 +2,8 @@
 Test the AI Router functionality
 """
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
@@ -9,46 +11,53 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from agent.router import QueryRouter, QueryType
 
+# One router shared by the tests below
+router = QueryRouter()
+
 
 def test_router():
     """Test the query router with various query types"""
-    router = QueryRouter()
-    
     print("=" * 60)
     print("Testing AI Router - Query Classification")
     print("=" * 60)
     
-    # Test cases
-    test_queries = [
+    # Test cases: query -> expected type
+    test_queries = {
         # Direct lookups
-        ("Find john.doe@sample.com", QueryType.DIRECT_LOOKUP),
-        ("What's the email for jane.smith@sample.com?", QueryType.DIRECT_LOOKUP),
+        "Find john.doe@sample.com": QueryType.DIRECT_LOOKUP,
+        "What's the email for jane.smith@sample.com?": QueryType.DIRECT_LOOKUP,
         
         # Simple searches
-        ("Find someone in billing team", QueryType.SIMPLE_SEARCH),
-        ("Who is in Auckland office?", QueryType.SIMPLE_SEARCH),
-        ("Show me network engineers", QueryType.SIMPLE_SEARCH),
+        "Find someone in billing team": QueryType.SIMPLE_SEARCH,
+        "Who is in Auckland office?": QueryType.SIMPLE_SEARCH,
+        "Show me network engineers": QueryType.SIMPLE_SEARCH,
         
         # Complex intents
-        ("I need help with BIA provisioning for a new customer", QueryType.COMPLEX_INTENT),
-        ("Who can assist with network security compliance?", QueryType.COMPLEX_INTENT),
-        ("Looking for someone to help set up enterprise provisioning", QueryType.COMPLEX_INTENT),
+        "I need help with BIA provisioning for a new customer": QueryType.COMPLEX_INTENT,
+        "Who can assist with network security compliance?": QueryType.COMPLEX_INTENT,
+        "Looking for someone to help set up enterprise provisioning": QueryType.COMPLEX_INTENT,
         
         # Conversational
-        ("Thanks for the help!", QueryType.CONVERSATIONAL),
-        ("Hello", QueryType.CONVERSATIONAL),
-        ("Goodbye", QueryType.CONVERSATIONAL),
+        "Thanks for the help!": QueryType.CONVERSATIONAL,
+        "Hello": QueryType.CONVERSATIONAL,
+        "Goodbye": QueryType.CONVERSATIONAL,
         
         # Ambiguous
-        ("Help", QueryType.AMBIGUOUS),
-        ("Find", QueryType.AMBIGUOUS),
-    ]
+        "Help": QueryType.AMBIGUOUS,
+        "Find": QueryType.AMBIGUOUS,
+    }
+    
+    # Classify each query once (concurrently; QueryRouter holds no mutable state)
+    # and reuse the results for the summaries below. map() keeps the input order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        routed = executor.map(router.route_query, test_queries)
+        results = [(query, expected_type, result)
+                   for (query, expected_type), result in zip(test_queries.items(), routed)]
     
     passed = 0
     failed = 0
     
-    for query, expected_type in test_queries:
-        result = router.route_query(query)
+    for query, expected_type, result in results:
         actual_type = result['query_type']
         strategy = result['strategy']
         confidence = result['confidence']
@@ -82,13 +91,9 @@ def test_router():
     print("Strategy Distribution:")
     print("=" * 60)
     
-    strategies = {}
-    for query, _ in test_queries:
-        result = router.route_query(query)
-        strategy = result['strategy']
-        strategies[strategy] = strategies.get(strategy, 0) + 1
+    strategies = Counter(result['strategy'] for _, _, result in results)
     
-    for strategy, count in strategies.items():
+    for strategy, count in strategies.most_common():
         percentage = (count / len(test_queries)) * 100
         print(f"{strategy:10s}: {count:2d} queries ({percentage:5.1f}%)")
     
@@ -96,7 +101,7 @@ def test_router():
     print("AI Usage Analysis:")
     print("=" * 60)
     
-    ai_needed = sum(1 for q, _ in test_queries if router.should_use_ai(router.route_query(q)))
+    ai_needed = sum(1 for _, _, result in results if router.should_use_ai(result))
     no_ai_needed = len(test_queries) - ai_needed
     
     print(f"Queries needing AI:     {ai_needed:2d} ({ai_needed/len(test_queries)*100:5.1f}%)")
@@ -108,8 +113,6 @@ def test_router():
 
 def test_should_use_ai():
     """Test the should_use_ai method"""
-    router = QueryRouter()
-    
     print("\n" + "=" * 60)
     print("Testing should_use_ai() Method")
     print("=" * 60)